@@ -2,5 +2,6 @@
 
 from .github_client import GitHubClient
 from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
 
-__all__ = ["GitHubClient", "RateLimiter"]
+__all__ = ["GitHubClient", "RateLimiter", "ResponseCache"]
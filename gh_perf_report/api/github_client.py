@@ -1,48 +1,184 @@
-"""GitHub API client using gh CLI."""
+"""GitHub API client using a pooled HTTP session."""
 
-import json
+import concurrent.futures
+import functools
+import os
+import re
+import shutil
 import subprocess
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional faster JSON decoder
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
 from ..utils.errors import GitHubAPIError, ArtifactNotFoundError
-from ..config import ARTIFACT_PREFIX_DEVICE_PERF
+from ..utils.job_patterns import JOB_NAME_TT_MODEL_RE, JOB_NAME_PERF_BENCHMARK_RE
+from ..config import ARTIFACT_PREFIX_DEVICE_PERF, DEFAULT_MAX_WORKERS, GITHUB_API_URL
+
+# Device perf artifact name: "device-perf-{job_id}"
+_RE_ARTIFACT_JOB_ID = re.compile(rf"{re.escape(ARTIFACT_PREFIX_DEVICE_PERF)}(\d+)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_job_name(job_name: str) -> str:
+    """
+    Normalize job name for matching.
+
+    Extracts the model identifier (e.g., "tt-xla-efficientnet") from
+    the full job name for reliable matching across workflow attempts.
+    """
+    match = JOB_NAME_TT_MODEL_RE.search(job_name)
+    if match:
+        return match.group(0).lower()
+    # Include benchmark type (n150-perf, p150, llmbox) in key to avoid
+    # cross-hardware collisions when comparing runs.
+    match = JOB_NAME_PERF_BENCHMARK_RE.search(job_name)
+    if match:
+        model, bench_type = match.group(1), match.group(2)
+        return f"{bench_type}/{model}".lower()
+    return job_name.lower()
 
 
 class GitHubClient:
-    """Wrapper around GitHub CLI for API interactions."""
+    """Client for GitHub REST API interactions.
+
+    Authentication uses ``GH_TOKEN``/``GITHUB_TOKEN`` or the token of the
+    GitHub CLI (``gh auth token``), resolved once on the first request; all
+    requests then go through a single keep-alive session instead of
+    spawning ``gh`` per call.
+    """
 
-    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+    def __init__(
+        self, rate_limiter: Optional[RateLimiter] = None, use_cache: bool = True
+    ):
         """
         Initialize GitHub client.
 
         Args:
             rate_limiter: Optional rate limiter instance
+            use_cache: Persist responses and artifacts on disk across runs
         """
         self.rate_limiter = rate_limiter or RateLimiter()
-        self._verify_gh_cli()
+        self.disk_cache = ResponseCache() if use_cache else None
+        self._session = self._create_session()
+        self._auth_lock = threading.Lock()
+        # Per-run responses, fetched once per client: (kind, owner, repo, run_id, ...)
+        self._run_cache: Dict[Tuple, Any] = {}
+
+    def _get_auth_token(self) -> str:
+        """Read the authentication token from the environment or the gh CLI."""
+        for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+            if os.environ.get(var):
+                return os.environ[var]
+
+        token = self._run_gh(
+            ["auth", "token"], "GitHub CLI not authenticated. Run: gh auth login"
+        ).strip()
+        if not token:
+            raise GitHubAPIError("GitHub CLI not authenticated. Run: gh auth login")
+        return token
+
+    @staticmethod
+    def _run_gh(args: List[str], error_message: str) -> str:
+        """
+        Run a gh CLI command and return its output.
+
+        Args:
+            args: Arguments passed to gh
+            error_message: Error reported if the command fails
 
-    def _verify_gh_cli(self) -> None:
-        """Verify gh CLI is installed and authenticated."""
+        Returns:
+            Standard output of the command
+        """
         try:
             result = subprocess.run(
-                ["gh", "auth", "status"],
+                ["gh", *args],
                 capture_output=True,
                 text=True,
-                check=False,
+                check=True,
             )
-            if result.returncode != 0:
-                raise GitHubAPIError(
-                    "GitHub CLI not authenticated. Run: gh auth login"
-                )
         except FileNotFoundError:
             raise GitHubAPIError(
                 "GitHub CLI not found. Install from: https://cli.github.com/"
             )
+        except subprocess.CalledProcessError as e:
+            detail = e.stderr.strip() if e.stderr else ""
+            raise GitHubAPIError(f"{error_message} ({detail})" if detail else error_message)
+        return result.stdout
+
+    def _ensure_authenticated(self) -> None:
+        """Attach the authentication token to the session on first use."""
+        if "Authorization" in self._session.headers:
+            return
+        with self._auth_lock:
+            if "Authorization" not in self._session.headers:
+                token = self._get_auth_token()
+                self._session.headers["Authorization"] = f"Bearer {token}"
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a session with connection pooling and retries."""
+        session = requests.Session()
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+        return session
+
+    def _request(self, endpoint: str, method: str = "GET", **kwargs) -> requests.Response:
+        """
+        Send a request to the GitHub API.
+
+        Args:
+            endpoint: API endpoint path (relative to the API root) or an
+                absolute URL, such as a pagination link
+            method: HTTP method (default: GET)
+            **kwargs: Extra arguments passed to ``requests.Session.request``
+
+        Returns:
+            Successful response
+        """
+        self._ensure_authenticated()
+        self.rate_limiter.wait_if_needed()
+
+        url = endpoint if endpoint.startswith("https://") else f"{GITHUB_API_URL}/{endpoint}"
+        try:
+            response = self._session.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except requests.HTTPError as e:
+            if e.response.status_code == 401:
+                raise GitHubAPIError(
+                    "GitHub authentication failed. Run: gh auth login"
+                )
+            raise GitHubAPIError(
+                f"GitHub API call failed: {e.response.status_code} {e.response.text}"
+            )
+        except requests.RequestException as e:
+            raise GitHubAPIError(f"GitHub API call failed: {e}")
 
     def _gh_api_call(self, endpoint: str, method: str = "GET") -> Dict:
         """
-        Make GitHub API call using gh CLI.
+        Make GitHub API call and decode the JSON response.
 
         Args:
             endpoint: API endpoint path
@@ -51,25 +187,125 @@ class GitHubClient:
         Returns:
             Parsed JSON response
         """
-        self.rate_limiter.wait_if_needed()
+        if method == "GET":
+            return self._get_json(endpoint)[0]
 
-        cmd = ["gh", "api", endpoint]
-        if method != "GET":
-            cmd.extend(["--method", method])
+        response = self._request(endpoint, method)
+        return self._decode_json(response.content)
 
+    @staticmethod
+    def _decode_json(content: bytes) -> Any:
+        """Decode a JSON response body."""
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return json.loads(result.stdout) if result.stdout else {}
-        except subprocess.CalledProcessError as e:
-            raise GitHubAPIError(f"GitHub API call failed: {e.stderr}")
-        except json.JSONDecodeError as e:
+            return _json_loads(content) if content else {}
+        except ValueError as e:
             raise GitHubAPIError(f"Invalid JSON response: {e}")
 
+    def _get_json(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        GET a JSON endpoint, revalidating a cached copy with its ETag.
+
+        A 304 Not Modified answer has no body and does not count against
+        GitHub's rate limit, so unchanged responses are nearly free.
+
+        Args:
+            endpoint: API endpoint path or absolute URL
+            params: Optional query parameters
+
+        Returns:
+            Tuple of (parsed JSON response, URL of the next page or None)
+        """
+        cache_key = ("etag", endpoint, params)
+        cached = self.disk_cache.get(cache_key) if self.disk_cache else None
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        response = self._request(endpoint, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return self._decode_json(cached["body"].encode("utf-8")), cached["next"]
+
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+        if self.disk_cache and etag:
+            # Revalidated on every use, so the entry itself never expires
+            self.disk_cache.set(
+                cache_key,
+                {"etag": etag, "body": response.content.decode("utf-8"), "next": next_url},
+            )
+        return self._decode_json(response.content), next_url
+
+    def _cached(
+        self,
+        key: Tuple,
+        fetch: Callable[[], Any],
+        is_immutable: Callable[[Any], bool],
+    ) -> Any:
+        """
+        Return the cached value for key, fetching it on first use.
+
+        Only immutable values are stored on disk. Anything else is fetched
+        again on each run; fetch goes through _get_json, whose ETag
+        revalidation makes an unchanged response cheap.
+
+        Args:
+            key: Cache key
+            fetch: Callable fetching the value from the API
+            is_immutable: Whether a fetched value can be kept on disk forever
+        """
+        if key in self._run_cache:
+            return self._run_cache[key]
+
+        value = self.disk_cache.get(key) if self.disk_cache else None
+        if value is None:
+            value = fetch()
+            if self.disk_cache and is_immutable(value):
+                self.disk_cache.set(key, value)
+
+        self._run_cache[key] = value
+        return value
+
+    @staticmethod
+    def _run_attempt(run_data: Dict) -> Tuple[int, bool]:
+        """
+        Latest attempt of a workflow run and whether it has completed.
+
+        Re-running a workflow reuses its run ID, so data derived from a run
+        is keyed by attempt and only final once that attempt has completed.
+
+        Args:
+            run_data: Workflow run data
+
+        Returns:
+            Tuple of (run attempt, completed)
+        """
+        return run_data.get("run_attempt") or 1, run_data.get("status") == "completed"
+
+    def _paginate(
+        self, endpoint: str, key: str, params: Optional[Dict] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Iterate over the pages of a paginated list endpoint.
+
+        Follows the ``Link: rel="next"`` header of each response, reusing
+        the session connection for every page.
+
+        Args:
+            endpoint: API endpoint path
+            key: Response field holding the page items (e.g. "jobs")
+            params: Extra query parameters for the first page
+
+        Yields:
+            Items of each page
+        """
+        url: Optional[str] = endpoint
+        query: Optional[Dict] = {"per_page": 100, **(params or {})}
+        while url:
+            data, next_url = self._get_json(url, query)
+            yield data.get(key, [])
+            # The next link already carries the query parameters
+            url, query = next_url, None
+
     def get_workflow_run(self, owner: str, repo: str, run_id: int) -> Dict:
         """
         Get workflow run details.
@@ -83,9 +319,50 @@ class GitHubClient:
             Workflow run data
         """
         endpoint = f"repos/{owner}/{repo}/actions/runs/{run_id}"
-        return self._gh_api_call(endpoint)
+        # Never final: a completed run can be re-run under the same ID
+        return self._cached(
+            ("run", owner, repo, run_id),
+            lambda: self._gh_api_call(endpoint),
+            lambda _: False,
+        )
+
+    def get_run_bundle(
+        self, owner: str, repo: str, run_id: int
+    ) -> Tuple[Dict, List[Dict], List[Dict]]:
+        """
+        Fetch run details, then the jobs and artifacts of the run concurrently.
 
-    def get_workflow_jobs(self, owner: str, repo: str, run_id: int) -> List[Dict]:
+        The listings are keyed by the run's attempt, so the run is fetched
+        first and handed to both; the two listings are then requested in
+        parallel instead of one round-trip after another. Results are cached
+        like those of the individual getters.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            run_id: Workflow run ID
+
+        Returns:
+            Tuple of (run data, job list, artifact list)
+        """
+        run_data = self.get_workflow_run(owner, repo, run_id)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            jobs_future = executor.submit(
+                self.get_workflow_jobs, owner, repo, run_id, run_data=run_data
+            )
+            artifacts_future = executor.submit(
+                self.list_artifacts, owner, repo, run_id, run_data=run_data
+            )
+            return run_data, jobs_future.result(), artifacts_future.result()
+
+    def get_workflow_jobs(
+        self,
+        owner: str,
+        repo: str,
+        run_id: int,
+        all_attempts: bool = False,
+        run_data: Optional[Dict] = None,
+    ) -> List[Dict]:
         """
         Get all jobs for a workflow run (with pagination).
 
@@ -93,31 +370,28 @@ class GitHubClient:
             owner: Repository owner
             repo: Repository name
             run_id: Workflow run ID
+            all_attempts: Include jobs of previous run attempts (default:
+                only the latest attempt)
+            run_data: Workflow run data, if already fetched
 
         Returns:
             List of job data
         """
-        self.rate_limiter.wait_if_needed()
-
-        endpoint = f"repos/{owner}/{repo}/actions/runs/{run_id}/jobs?per_page=100"
-        cmd = ["gh", "api", endpoint, "--paginate", "--jq", ".jobs"]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            jobs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    jobs.extend(json.loads(line))
-            return jobs
-        except subprocess.CalledProcessError as e:
-            raise GitHubAPIError(f"GitHub API call failed: {e.stderr}")
-        except json.JSONDecodeError as e:
-            raise GitHubAPIError(f"Invalid JSON response: {e}")
+        endpoint = f"repos/{owner}/{repo}/actions/runs/{run_id}/jobs"
+        params = {"filter": "all" if all_attempts else "latest"}
+        run_attempt, completed = self._run_attempt(
+            run_data or self.get_workflow_run(owner, repo, run_id)
+        )
+        return self._cached(
+            ("jobs", owner, repo, run_id, run_attempt, all_attempts),
+            lambda: [
+                job
+                for page in self._paginate(endpoint, "jobs", params)
+                for job in page
+            ],
+            # An empty listing may just not be populated yet
+            lambda jobs: completed and bool(jobs),
+        )
 
     def get_job_logs(self, owner: str, repo: str, job_id: int) -> str:
         """
@@ -131,23 +405,15 @@ class GitHubClient:
         Returns:
             Job logs as string
         """
-        self.rate_limiter.wait_if_needed()
-
         endpoint = f"repos/{owner}/{repo}/actions/jobs/{job_id}/logs"
-        cmd = ["gh", "api", endpoint]
-
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            raise GitHubAPIError(f"Failed to fetch logs: {e.stderr}")
+            return self._request(endpoint).text
+        except GitHubAPIError as e:
+            raise GitHubAPIError(f"Failed to fetch logs: {e}")
 
-    def list_artifacts(self, owner: str, repo: str, run_id: int) -> List[Dict]:
+    def list_artifacts(
+        self, owner: str, repo: str, run_id: int, run_data: Optional[Dict] = None
+    ) -> List[Dict]:
         """
         List all artifacts for a workflow run (with pagination).
 
@@ -155,34 +421,79 @@ class GitHubClient:
             owner: Repository owner
             repo: Repository name
             run_id: Workflow run ID
+            run_data: Workflow run data, if already fetched
 
         Returns:
             List of artifact data
         """
-        self.rate_limiter.wait_if_needed()
-
         endpoint = f"repos/{owner}/{repo}/actions/runs/{run_id}/artifacts"
-        cmd = ["gh", "api", endpoint, "--paginate", "--jq", ".artifacts"]
-
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
+            run_attempt, completed = self._run_attempt(
+                run_data or self.get_workflow_run(owner, repo, run_id)
             )
-            # --paginate with --jq returns one JSON array per page, concatenated
-            # We need to parse each line as a separate array and combine them
-            artifacts = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    page_artifacts = json.loads(line)
-                    artifacts.extend(page_artifacts)
-            return artifacts
-        except subprocess.CalledProcessError as e:
-            raise GitHubAPIError(f"Failed to list artifacts: {e.stderr}")
-        except json.JSONDecodeError as e:
-            raise GitHubAPIError(f"Invalid JSON response: {e}")
+            return self._cached(
+                ("artifacts", owner, repo, run_id, run_attempt),
+                lambda: [
+                    artifact
+                    for page in self._paginate(endpoint, "artifacts")
+                    for artifact in page
+                ],
+                lambda _: completed,
+            )
+        except GitHubAPIError as e:
+            raise GitHubAPIError(f"Failed to list artifacts: {e}")
+
+    def list_artifacts_many(
+        self, owner: str, repo: str, run_ids: List[int]
+    ) -> Dict[int, List[Dict]]:
+        """
+        List the artifacts of several workflow runs concurrently.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            run_ids: Workflow run IDs
+
+        Returns:
+            Dict mapping run ID -> list of artifact data
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=DEFAULT_MAX_WORKERS
+        ) as executor:
+            results = executor.map(
+                lambda run_id: self.list_artifacts(owner, repo, run_id), run_ids
+            )
+            return dict(zip(run_ids, results))
+
+    def iter_artifacts(self, owner: str, repo: str, run_id: int) -> Iterator[Dict]:
+        """
+        Iterate over the artifacts of a workflow run.
+
+        Uses the listing if it was already fetched; otherwise pages are
+        requested lazily, so callers that stop early skip the remaining pages.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            run_id: Workflow run ID
+
+        Yields:
+            Artifact data
+        """
+        run_data = self._run_cache.get(("run", owner, repo, run_id))
+        if run_data is not None:
+            run_attempt, _ = self._run_attempt(run_data)
+            cached = self._run_cache.get(("artifacts", owner, repo, run_id, run_attempt))
+            if cached is not None:
+                yield from cached
+                return
+
+        endpoint = f"repos/{owner}/{repo}/actions/runs/{run_id}/artifacts"
+        try:
+            for page in self._paginate(endpoint, "artifacts"):
+                yield from page
+        except GitHubAPIError as e:
+            raise GitHubAPIError(f"Failed to list artifacts: {e}")
 
     def download_artifact(
         self, owner: str, repo: str, artifact_id: int, output_path: str
@@ -199,18 +510,48 @@ class GitHubClient:
         Returns:
             Output path
         """
-        self.rate_limiter.wait_if_needed()
+        if self.disk_cache and self.disk_cache.get_artifact(artifact_id, output_path):
+            return output_path
 
         endpoint = f"repos/{owner}/{repo}/actions/artifacts/{artifact_id}/zip"
-        cmd = ["gh", "api", endpoint]
-
         try:
-            # gh api returns binary data, redirect to file
-            with open(output_path, "wb") as f:
-                result = subprocess.run(cmd, check=True, stdout=f, stderr=subprocess.PIPE)
+            # Stream the body straight to disk in large chunks
+            with self._request(endpoint, stream=True) as response:
+                response.raw.decode_content = True
+                with open(output_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+            if self.disk_cache:
+                self.disk_cache.set_artifact(artifact_id, output_path)
             return output_path
-        except subprocess.CalledProcessError as e:
-            raise ArtifactNotFoundError(f"Failed to download artifact: {e.stderr.decode() if e.stderr else 'Unknown error'}")
+        except (GitHubAPIError, requests.RequestException) as e:
+            raise ArtifactNotFoundError(f"Failed to download artifact: {e}")
+
+    def download_artifact_stream(self, owner: str, repo: str, artifact_id: int) -> bytes:
+        """
+        Download artifact ZIP into memory.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            artifact_id: Artifact ID
+
+        Returns:
+            ZIP file content
+        """
+        if self.disk_cache:
+            data = self.disk_cache.get_artifact_bytes(artifact_id)
+            if data is not None:
+                return data
+
+        endpoint = f"repos/{owner}/{repo}/actions/artifacts/{artifact_id}/zip"
+        try:
+            data = self._request(endpoint).content
+        except (GitHubAPIError, requests.RequestException) as e:
+            raise ArtifactNotFoundError(f"Failed to download artifact: {e}")
+
+        if self.disk_cache:
+            self.disk_cache.set_artifact_bytes(artifact_id, data)
+        return data
 
     def find_device_perf_artifact(
         self, owner: str, repo: str, run_id: int, job_id: int
@@ -227,13 +568,19 @@ class GitHubClient:
         Returns:
             Artifact data or None if not found
         """
-        artifacts = self.list_artifacts(owner, repo, run_id)
-        pattern = f"{ARTIFACT_PREFIX_DEVICE_PERF}{job_id}"
-
-        for artifact in artifacts:
-            if pattern in artifact.get("name", ""):
-                return artifact
-        return None
+        return self._artifacts_by_job_id(owner, repo, run_id).get(job_id)
+
+    def _artifacts_by_job_id(self, owner: str, repo: str, run_id: int) -> Dict[int, Dict]:
+        """Map job IDs to their device-perf artifacts (device-perf-{job_id})."""
+        key = ("artifacts_by_job_id", owner, repo, run_id)
+        if key not in self._run_cache:
+            by_job_id = {}
+            for artifact in self.list_artifacts(owner, repo, run_id):
+                match = _RE_ARTIFACT_JOB_ID.match(artifact.get("name", ""))
+                if match:
+                    by_job_id[int(match.group(1))] = artifact
+            self._run_cache[key] = by_job_id
+        return self._run_cache[key]
 
     def find_device_perf_artifact_by_job_name(
         self, owner: str, repo: str, run_id: int, job_name: str, artifacts_cache: Optional[dict] = None
@@ -256,12 +603,12 @@ class GitHubClient:
         """
         if artifacts_cache is not None:
             # Use pre-built cache
-            normalized_name = self._normalize_job_name(job_name)
+            normalized_name = _normalize_job_name(job_name)
             return artifacts_cache.get(normalized_name)
 
         # Fall back to building cache on demand (less efficient)
         cache = self.build_artifact_cache(owner, repo, run_id)
-        normalized_name = self._normalize_job_name(job_name)
+        normalized_name = _normalize_job_name(job_name)
         return cache.get(normalized_name)
 
     def build_artifact_cache(self, owner: str, repo: str, run_id: int) -> dict:
@@ -279,33 +626,24 @@ class GitHubClient:
         Returns:
             Dict mapping normalized job name -> artifact data
         """
-        import re
+        artifacts_by_job_id = self._artifacts_by_job_id(owner, repo, run_id)
 
-        artifacts = self.list_artifacts(owner, repo, run_id)
-        cache = {}
+        # Artifacts of a re-run may belong to jobs of earlier attempts; for a
+        # first attempt the latest job listing already covers every job
+        run_data = self.get_workflow_run(owner, repo, run_id)
+        all_attempts = (run_data.get("run_attempt") or 1) > 1
+        jobs = self.get_workflow_jobs(
+            owner, repo, run_id, all_attempts=all_attempts, run_data=run_data
+        )
+        jobs_by_id = {job["id"]: job for job in jobs}
 
-        for artifact in artifacts:
-            artifact_name = artifact.get("name", "")
-            if not artifact_name.startswith(ARTIFACT_PREFIX_DEVICE_PERF):
-                continue
-
-            # Extract job ID from artifact name (device-perf-{job_id})
-            match = re.match(rf"{ARTIFACT_PREFIX_DEVICE_PERF}(\d+)", artifact_name)
-            if not match:
-                continue
-
-            artifact_job_id = int(match.group(1))
-
-            # Look up the job to get its name
-            try:
-                job_data = self.get_job(owner, repo, artifact_job_id)
-                if job_data:
-                    job_name = job_data.get("name", "")
-                    normalized = self._normalize_job_name(job_name)
-                    cache[normalized] = artifact
-            except Exception:
-                # Skip artifacts we can't resolve
-                continue
+        cache = {}
+        for artifact_job_id, artifact in artifacts_by_job_id.items():
+            # Skip artifacts we can't resolve
+            job_data = jobs_by_id.get(artifact_job_id)
+            if job_data:
+                normalized = _normalize_job_name(job_data.get("name", ""))
+                cache[normalized] = artifact
 
         return cache
 
@@ -321,31 +659,8 @@ class GitHubClient:
         Returns:
             Job data or None if not found
         """
-        self.rate_limiter.wait_if_needed()
-
         endpoint = f"repos/{owner}/{repo}/actions/jobs/{job_id}"
         try:
             return self._gh_api_call(endpoint)
         except GitHubAPIError:
             return None
-
-    def _normalize_job_name(self, job_name: str) -> str:
-        """
-        Normalize job name for matching.
-
-        Extracts the model identifier (e.g., "tt-xla-efficientnet") from
-        the full job name for reliable matching across workflow attempts.
-        """
-        import re
-        # Old format: "... / tt-xla-model-name ..."
-        match = re.search(r"(tt-(?:xla|forge)-[a-zA-Z0-9_-]+)", job_name, re.IGNORECASE)
-        if match:
-            return match.group(1).lower()
-        # New tt-xla format: "run-n150-perf-benchmarks / perf model_name (n150-perf)"
-        # Include benchmark type (n150-perf, p150, llmbox) in key to avoid
-        # cross-hardware collisions when comparing runs.
-        match = re.search(r"/\s*perf\s+([a-zA-Z0-9_][a-zA-Z0-9_.-]*)\s*\(([^)]+)\)", job_name, re.IGNORECASE)
-        if match:
-            model, bench_type = match.group(1), match.group(2)
-            return f"{bench_type}/{model}".lower()
-        return job_name.lower()
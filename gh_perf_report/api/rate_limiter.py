@@ -1,32 +1,48 @@
 """Rate limiter for GitHub API calls."""
 
+import threading
 import time
-from typing import Optional
 
-from ..config import DEFAULT_API_RATE_LIMIT
+from ..config import DEFAULT_API_BURST, DEFAULT_API_RATE_LIMIT
 
 
 class RateLimiter:
-    """Simple rate limiter for GitHub API calls."""
+    """Thread-safe token-bucket rate limiter for GitHub API calls.
 
-    def __init__(self, calls_per_second: float = DEFAULT_API_RATE_LIMIT):
+    Allows bursts of up to ``burst`` calls while keeping the average rate at
+    ``calls_per_second``.
+    """
+
+    def __init__(
+        self,
+        calls_per_second: float = DEFAULT_API_RATE_LIMIT,
+        burst: int = DEFAULT_API_BURST,
+    ):
         """
         Initialize rate limiter.
 
         Args:
-            calls_per_second: Maximum number of API calls per second
+            calls_per_second: Average number of API calls per second
+            burst: Maximum number of calls allowed back to back
         """
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call_time: Optional[float] = None
+        self._rate = calls_per_second
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limit."""
-        if self.last_call_time is None:
-            self.last_call_time = time.time()
-            return
-
-        elapsed = time.time() - self.last_call_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-
-        self.last_call_time = time.time()
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self._rate
+            )
+            self._last_refill = now
+            # Reserve a token; a negative balance is the wait owed by this caller
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        # Sleep outside the lock so other threads can reserve their tokens
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,170 @@
+"""On-disk cache for GitHub API responses and artifacts."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Tuple
+
+from ..config import CACHE_DIR_NAME, CACHE_MAX_ARTIFACT_BYTES
+
+
+class ResponseCache:
+    """Persistent cache shared across CLI invocations.
+
+    Only final data is stored (e.g. data of completed workflow runs, or
+    responses revalidated by ETag on every use), so entries never expire.
+    Artifact ZIPs are evicted least recently used first once they exceed
+    ``max_artifact_bytes`` in total.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_artifact_bytes: int = CACHE_MAX_ARTIFACT_BYTES,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Cache directory (default: ~/CACHE_DIR_NAME)
+            max_artifact_bytes: Total size of cached artifact ZIPs to keep
+        """
+        self.cache_dir = cache_dir or Path.home() / CACHE_DIR_NAME
+        self.max_artifact_bytes = max_artifact_bytes
+
+    def _response_path(self, key: Tuple) -> Path:
+        """Path of the file holding the response for key."""
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return self.cache_dir / "responses" / f"{digest}.json"
+
+    def artifact_path(self, artifact_id: int) -> Path:
+        """Path of the cached ZIP for an artifact."""
+        return self.cache_dir / "artifacts" / f"{artifact_id}.zip"
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data, or None if missing or unreadable
+        """
+        try:
+            with open(self._response_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry.get("data")
+
+    def set(self, key: Tuple, data: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            data: JSON-serializable response data
+        """
+        entry = {"created": time.time(), "data": data}
+        try:
+            with self._atomic_write(self._response_path(key)) as f:
+                f.write(json.dumps(entry).encode("utf-8"))
+        except OSError:
+            # Caching is best effort
+            pass
+
+    def get_artifact(self, artifact_id: int, output_path: str) -> bool:
+        """
+        Copy a cached artifact ZIP to output_path.
+
+        Returns:
+            True if the artifact was cached
+        """
+        path = self.artifact_path(artifact_id)
+        try:
+            shutil.copyfile(path, output_path)
+            self._touch(path)
+            return True
+        except OSError:
+            return False
+
+    def set_artifact(self, artifact_id: int, zip_path: str) -> None:
+        """Store a downloaded artifact ZIP."""
+        try:
+            with open(zip_path, "rb") as src:
+                with self._atomic_write(self.artifact_path(artifact_id)) as dst:
+                    shutil.copyfileobj(src, dst)
+        except OSError:
+            return
+        self._prune_artifacts()
+
+    def get_artifact_bytes(self, artifact_id: int) -> Optional[bytes]:
+        """
+        Read a cached artifact ZIP.
+
+        Returns:
+            ZIP content, or None if the artifact is not cached
+        """
+        path = self.artifact_path(artifact_id)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    def set_artifact_bytes(self, artifact_id: int, data: bytes) -> None:
+        """Store downloaded artifact ZIP content."""
+        try:
+            with self._atomic_write(self.artifact_path(artifact_id)) as f:
+                f.write(data)
+        except OSError:
+            return
+        self._prune_artifacts()
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark a cached artifact as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _prune_artifacts(self) -> None:
+        """Evict least recently used artifact ZIPs beyond max_artifact_bytes."""
+        artifacts = []
+        total = 0
+        for path in (self.cache_dir / "artifacts").glob("*.zip"):
+            try:
+                stat = path.stat()
+            except OSError:
+                # Removed concurrently
+                continue
+            artifacts.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        artifacts.sort()
+        for _, size, path in artifacts:
+            if total <= self.max_artifact_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    @contextmanager
+    def _atomic_write(self, path: Path) -> Iterator[BinaryIO]:
+        """Open path for writing so readers never observe a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
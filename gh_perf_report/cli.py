@@ -1,12 +1,11 @@
 """CLI interface for gh-perf-report."""
 
+import concurrent.futures
+
 import click
-from rich.console import Console
 
-from .api.github_client import GitHubClient
-from .processors.report_processor import ReportProcessor
-from .processors.compare_processor import CompareProcessor
-from .formatters.table_formatter import TableFormatter
+# Heavy modules (rich, requests, processors) are imported inside the commands
+# so that --help and shell completion start quickly.
 from .utils.errors import GitHubAPIError, ProcessingError
 from .config import DEFAULT_OWNER, SUPPORTED_REPOS, DEFAULT_MAX_WORKERS
 
@@ -40,18 +39,29 @@ def cli():
     default=DEFAULT_MAX_WORKERS,
     help=f"Number of parallel workers (default: {DEFAULT_MAX_WORKERS})",
 )
-def report(run_id: int, repo: str, owner: str, workers: int):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable caching of API responses and artifacts",
+)
+def report(run_id: int, repo: str, owner: str, workers: int, no_cache: bool):
     """
     Generate performance report for a single workflow run.
 
     Example:
         gh-perf-report report 12345 --repo tt-xla
     """
+    from rich.console import Console
+
+    from .api.github_client import GitHubClient
+    from .processors.report_processor import ReportProcessor
+    from .formatters.table_formatter import TableFormatter
+
     console = Console()
 
     try:
         # Initialize components
-        github_client = GitHubClient()
+        github_client = GitHubClient(use_cache=not no_cache)
         processor = ReportProcessor(github_client)
         formatter = TableFormatter(console)
 
@@ -102,6 +112,11 @@ def report(run_id: int, repo: str, owner: str, workers: int):
     default=DEFAULT_MAX_WORKERS,
     help=f"Number of parallel workers (default: {DEFAULT_MAX_WORKERS})",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable caching of API responses and artifacts",
+)
 def compare(
     baseline_run_id: int,
     current_run_id: int,
@@ -109,6 +124,7 @@ def compare(
     current_repo: str,
     owner: str,
     workers: int,
+    no_cache: bool,
 ):
     """
     Compare performance between two workflow runs.
@@ -117,6 +133,13 @@ def compare(
         gh-perf-report compare 12345 12346 --baseline-repo tt-xla
         gh-perf-report compare 12345 67890 --baseline-repo tt-xla --current-repo tt-forge
     """
+    from rich.console import Console
+
+    from .api.github_client import GitHubClient
+    from .processors.report_processor import ReportProcessor
+    from .processors.compare_processor import CompareProcessor
+    from .formatters.table_formatter import TableFormatter
+
     console = Console()
 
     # Default current_repo to baseline_repo
@@ -125,26 +148,39 @@ def compare(
 
     try:
         # Initialize components
-        github_client = GitHubClient()
+        github_client = GitHubClient(use_cache=not no_cache)
         report_processor = ReportProcessor(github_client)
         compare_processor = CompareProcessor()
         formatter = TableFormatter(console)
 
-        # Process baseline run
-        console.print(
-            f"[cyan]Fetching baseline run {baseline_run_id} from {owner}/{baseline_repo}...[/cyan]"
-        )
-        baseline_report = report_processor.process_workflow_run(
-            owner, baseline_repo, baseline_run_id, workers
-        )
-
-        # Process current run
-        console.print(
-            f"[cyan]Fetching current run {current_run_id} from {owner}/{current_repo}...[/cyan]"
-        )
-        current_report = report_processor.process_workflow_run(
-            owner, current_repo, current_run_id, workers
-        )
+        # Process both runs concurrently; they are independent and network bound
+        # (a run compared against itself is only processed once)
+        same_run = current_run_id == baseline_run_id and current_repo == baseline_repo
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            console.print(
+                f"[cyan]Fetching baseline run {baseline_run_id} from {owner}/{baseline_repo}...[/cyan]"
+            )
+            baseline_future = executor.submit(
+                report_processor.process_workflow_run,
+                owner,
+                baseline_repo,
+                baseline_run_id,
+                workers,
+            )
+            current_future = baseline_future
+            if not same_run:
+                console.print(
+                    f"[cyan]Fetching current run {current_run_id} from {owner}/{current_repo}...[/cyan]"
+                )
+                current_future = executor.submit(
+                    report_processor.process_workflow_run,
+                    owner,
+                    current_repo,
+                    current_run_id,
+                    workers,
+                )
+            baseline_report = baseline_future.result()
+            current_report = current_future.result()
 
         # Compare reports
         console.print("[cyan]Comparing reports...[/cyan]")
@@ -179,17 +215,26 @@ def compare(
     default=DEFAULT_OWNER,
     help=f"Repository owner (default: {DEFAULT_OWNER})",
 )
-def list_jobs(run_id: int, repo: str, owner: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Disable caching of API responses and artifacts",
+)
+def list_jobs(run_id: int, repo: str, owner: str, no_cache: bool):
     """
     List all jobs in a workflow run (quick view).
 
     Example:
         gh-perf-report list-jobs 12345 --repo tt-xla
     """
+    from rich.console import Console
+
+    from .api.github_client import GitHubClient
+
     console = Console()
 
     try:
-        github_client = GitHubClient()
+        github_client = GitHubClient(use_cache=not no_cache)
         jobs = github_client.get_workflow_jobs(owner, repo, run_id)
 
         console.print(f"\n[bold cyan]Jobs for run {run_id}[/bold cyan]")
@@ -19,12 +19,14 @@ REGRESSION_THRESHOLD = -0.05  # 5% decrease is regression
 IMPROVEMENT_THRESHOLD = 0.05  # 5% increase is improvement
 
 # API configuration
+GITHUB_API_URL = "https://api.github.com"
 DEFAULT_API_RATE_LIMIT = 10  # calls per second
+DEFAULT_API_BURST = 20  # calls allowed back to back
 DEFAULT_MAX_WORKERS = 5
 
 # Cache configuration
-DEFAULT_CACHE_TTL_HOURS = 24
 CACHE_DIR_NAME = ".gh-perf-report"
+CACHE_MAX_ARTIFACT_BYTES = 2 * 1024**3  # 2 GiB of artifact ZIPs
 
 # CSV parsing configuration
 CSV_FILTER_COLUMNS = ["CONST_EVAL_OP", "INPUT_LAYOUT_CONVERSION_OP"]
@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.text import Text
 
@@ -12,8 +12,13 @@ from ..processors.models import (
     ComparisonResult,
     JobConclusion,
 )
+from ..utils.job_patterns import JOB_NAME_TT_MODEL_RE, JOB_NAME_PERF_MODEL_RE
 from .color_scheme import ColorScheme
 
+# Display limits for the job name fallback and error column
+_MAX_JOB_NAME_LEN = 50
+_MAX_ERROR_LEN = 60
+
 
 class TableFormatter:
     """Format reports as rich console tables."""
@@ -27,25 +32,81 @@ class TableFormatter:
         """
         self.console = console or Console()
         self.colors = ColorScheme()
+        # Styles are invisible when the console has no color system (e.g.
+        # output redirected to CI logs), so cells are then emitted as plain
+        # strings without Text objects
+        self._plain = self.console.color_system is None
+        colors = self.colors
+
+        # Markup strings are built once here rather than on every call
+        self._header_tags = (f"[{colors.HEADER}]", f"[/{colors.HEADER}]")
+        self._summary_template = (
+            "\n[bold]Summary:[/bold]\n"
+            "  Total jobs: {total}\n"
+            f"  [{colors.SUCCESS}]Success: {{success}}[/{colors.SUCCESS}]\n"
+            f"  [{colors.FAILURE}]Failed: {{failed}}[/{colors.FAILURE}]\n"
+            f"  [{colors.SKIPPED}]Skipped: {{skipped}}[/{colors.SKIPPED}]"
+        )
+        self._comparison_summary_template = (
+            "\n[bold]Summary:[/bold]\n"
+            "  Total comparisons: {total}\n"
+            f"  [{colors.RESULT_REGRESSION}]Regressions: {{regressions}}[/{colors.RESULT_REGRESSION}]\n"
+            f"  [{colors.RESULT_IMPROVEMENT}]Improvements: {{improvements}}[/{colors.RESULT_IMPROVEMENT}]\n"
+            f"  [{colors.RESULT_NEUTRAL}]Neutral: {{neutral}}[/{colors.RESULT_NEUTRAL}]"
+        )
+        self._new_jobs_template = f"\n  [{colors.RESULT_NEW}]New: {{}}[/{colors.RESULT_NEW}]"
+        self._removed_jobs_template = (
+            f"\n  [{colors.RESULT_REMOVED}]Removed: {{}}[/{colors.RESULT_REMOVED}]"
+        )
+
+        # Delta colors used in every comparison row
+        self._unchanged_style = colors.UNCHANGED
+        self._improvement_style = colors.IMPROVEMENT
+        self._regression_style = colors.REGRESSION
+
+        # Status cell prefix and style per job conclusion; any other
+        # conclusion is shown without prefix in the pending style
+        self._status_styles = {
+            JobConclusion.SUCCESS: ("+ ", colors.SUCCESS),
+            JobConclusion.FAILURE: ("x ", colors.FAILURE),
+            JobConclusion.SKIPPED: ("o ", colors.SKIPPED),
+        }
+        # Styles of completed workflow run conclusions
+        self._run_conclusion_styles = {
+            "success": colors.SUCCESS,
+            "failure": colors.FAILURE,
+        }
+
+        # Cells with a fixed text are built once and shared between rows;
+        # Rich does not modify a Text while rendering it
+        self._status_texts = {
+            conclusion: self._build_status_text(conclusion)
+            for conclusion in (None, *JobConclusion)
+        }
+        self._na_text = self._styled("N/A", colors.NEUTRAL)
+        self._new_text = self._styled("NEW", colors.RESULT_NEW)
+        self._removed_text = self._styled("REMOVED", colors.RESULT_REMOVED)
+        self._regression_text = self._styled("REGRESSION", colors.RESULT_REGRESSION)
+        self._improvement_text = self._styled("IMPROVEMENT", colors.RESULT_IMPROVEMENT)
+        self._neutral_text = self._styled("NEUTRAL", colors.RESULT_NEUTRAL)
 
     def print_workflow_report(self, report: WorkflowReport) -> None:
         """Print single workflow run report."""
-        # Print header
-        self.console.print(f"\n[{self.colors.HEADER}]Workflow Run Report[/{self.colors.HEADER}]")
-        self.console.print(f"Repo: {report.repo}")
-        self.console.print(f"Run ID: {report.run_id}")
-        self.console.print(f"Workflow: {report.workflow_name}")
-        self.console.print(f"Branch: {report.branch}")
-        self.console.print(
-            f"Status: {self._colorize_status(report.status, report.conclusion)}"
+        # Header, table and summary are rendered as one group in a single print
+        header_open, header_close = self._header_tags
+        header = self.console.render_str(
+            f"\n{header_open}Workflow Run Report{header_close}\n"
+            f"Repo: {report.repo}\n"
+            f"Run ID: {report.run_id}\n"
+            f"Workflow: {report.workflow_name}\n"
+            f"Branch: {report.branch}"
+        )
+        status = Text.assemble(
+            "Status: ", self._colorize_status(report.status, report.conclusion)
         )
-        self.console.print(f"Created: {report.created_at}\n")
+        created = self.console.render_str(f"Created: {report.created_at}\n")
 
-        # Determine max number of stages across all jobs
-        max_stages = 0
-        for job in report.jobs:
-            if job.device_perf_metrics and job.device_perf_metrics.stages:
-                max_stages = max(max_stages, len(job.device_perf_metrics.stages))
+        max_stages = report.max_stages
 
         # Create table
         table = Table(
@@ -74,10 +135,9 @@ class TableFormatter:
         for job in report.jobs:
             self._add_job_row_with_stages(table, job, max_stages)
 
-        self.console.print(table)
-
-        # Print summary
-        self._print_summary(report)
+        self.console.print(
+            Group(header, status, created, table, self._format_summary(report))
+        )
 
     def print_comparison_report(
         self,
@@ -86,12 +146,10 @@ class TableFormatter:
         current: WorkflowReport,
     ) -> None:
         """Print comparison report between two runs."""
-        # Print header
-        self.console.print(f"\n[{self.colors.HEADER}]Comparison Report[/{self.colors.HEADER}]")
-        self.console.print(
-            f"Baseline: {baseline.repo} run {baseline.run_id} ({baseline.branch})"
-        )
-        self.console.print(
+        header_open, header_close = self._header_tags
+        header = self.console.render_str(
+            f"\n{header_open}Comparison Report{header_close}\n"
+            f"Baseline: {baseline.repo} run {baseline.run_id} ({baseline.branch})\n"
             f"Current:  {current.repo} run {current.run_id} ({current.branch})\n"
         )
 
@@ -113,10 +171,9 @@ class TableFormatter:
         for comparison in comparisons:
             self._add_comparison_row(table, comparison)
 
-        self.console.print(table)
-
-        # Print summary
-        self._print_comparison_summary(comparisons)
+        self.console.print(
+            Group(header, table, self._format_comparison_summary(comparisons))
+        )
 
     def _add_job_row(self, table: Table, job: JobResult) -> None:
         """Add a row for a job result."""
@@ -152,28 +209,22 @@ class TableFormatter:
 
         # Build row data
         row_data = [job_display, status, samples_per_sec]
+        append = row_data.append
+        fmt = "{:.2f}".format
 
         # Add stage columns
-        stages = []
-        if job.device_perf_metrics and job.device_perf_metrics.stages:
-            stages = job.device_perf_metrics.stages
-
+        dpm = job.device_perf_metrics
+        stages = dpm.stages if dpm and dpm.stages else ()
+        n_stages = len(stages)
         for i in range(max_stages):
-            if i < len(stages):
-                row_data.append(f"{stages[i].duration_ms:.2f}")
-            else:
-                row_data.append("N/A")
+            append(fmt(stages[i].duration_ms) if i < n_stages else "N/A")
 
         # Add total column if multiple stages
         if max_stages > 1:
-            if job.device_perf_metrics:
-                row_data.append(f"{job.device_perf_metrics.total_op_duration_ms:.2f}")
-            else:
-                row_data.append("N/A")
+            append(fmt(dpm.total_op_duration_ms) if dpm else "N/A")
 
         # Error message
-        error = self._format_error(job)
-        row_data.append(error)
+        append(self._format_error(job))
 
         table.add_row(*row_data)
 
@@ -203,40 +254,40 @@ class TableFormatter:
             result,
         )
 
+    def _styled(self, text: str, style: str) -> RenderableType:
+        """Return text as a styled Text, or as-is for plain output."""
+        if self._plain:
+            return text
+        return Text(text, style=style)
+
     def _simplify_job_name(self, job_name: str) -> str:
         """Extract simplified job name for display."""
-        import re
-
-        match = re.search(r"(tt-(?:xla|forge)-[a-zA-Z0-9_-]+)", job_name, re.IGNORECASE)
+        match = JOB_NAME_TT_MODEL_RE.search(job_name)
         if match:
-            return match.group(1)
-        # New tt-xla format: "run-n150-perf-benchmarks / perf model_name (n150-perf)"
-        match = re.search(r"/\s*perf\s+([a-zA-Z0-9_][a-zA-Z0-9_.-]*)", job_name, re.IGNORECASE)
+            return match.group(0)
+        match = JOB_NAME_PERF_MODEL_RE.search(job_name)
         if match:
             return match.group(1)
-        return job_name[:50] if len(job_name) > 50 else job_name
+        return job_name if len(job_name) <= _MAX_JOB_NAME_LEN else job_name[:_MAX_JOB_NAME_LEN]
 
-    def _format_status(self, conclusion: Optional[JobConclusion]) -> Text:
+    def _format_status(self, conclusion: Optional[JobConclusion]) -> RenderableType:
         """Format job conclusion with color."""
+        return self._status_texts[conclusion]
+
+    def _build_status_text(self, conclusion: Optional[JobConclusion]) -> RenderableType:
+        """Build the colored status cell for a job conclusion."""
         if conclusion is None:
-            return Text("PENDING", style=self.colors.PENDING)
-
-        conclusion_str = conclusion.value.upper()
-        if conclusion == JobConclusion.SUCCESS:
-            return Text("+ " + conclusion_str, style=self.colors.SUCCESS)
-        elif conclusion == JobConclusion.FAILURE:
-            return Text("x " + conclusion_str, style=self.colors.FAILURE)
-        elif conclusion == JobConclusion.SKIPPED:
-            return Text("o " + conclusion_str, style=self.colors.SKIPPED)
-        else:
-            return Text(conclusion_str, style=self.colors.PENDING)
+            return self._styled("PENDING", self.colors.PENDING)
+
+        prefix, style = self._status_styles.get(conclusion, ("", self.colors.PENDING))
+        return self._styled(prefix + conclusion.value.upper(), style)
 
-    def _format_status_comparison(self, comparison: ComparisonResult) -> Text:
+    def _format_status_comparison(self, comparison: ComparisonResult) -> RenderableType:
         """Format status comparison."""
         if comparison.baseline is None:
-            return Text("NEW", style=self.colors.RESULT_NEW)
+            return self._new_text
         if comparison.current is None:
-            return Text("REMOVED", style=self.colors.RESULT_REMOVED)
+            return self._removed_text
 
         baseline_status = (
             comparison.baseline.conclusion.value
@@ -255,7 +306,7 @@ class TableFormatter:
                 if current_status == "failure"
                 else self.colors.SUCCESS
             )
-            return Text(f"{baseline_status} -> {current_status}", style=style)
+            return self._styled(f"{baseline_status} -> {current_status}", style)
         else:
             return self._format_status(comparison.current.conclusion)
 
@@ -271,58 +322,58 @@ class TableFormatter:
             return f"{job.device_perf_metrics.total_op_duration_ms:.2f}"
         return "N/A"
 
-    def _format_samples_delta(self, comparison: ComparisonResult) -> Text:
+    def _format_samples_delta(self, comparison: ComparisonResult) -> RenderableType:
         """Format samples per second delta with color."""
         if comparison.samples_per_sec_delta is None:
-            return Text("N/A", style=self.colors.NEUTRAL)
+            return self._na_text
 
         delta = comparison.samples_per_sec_delta
         color = self._get_delta_color(delta, inverse=False)
         symbol = "+" if delta >= 0 else ""
-        return Text(f"{symbol}{delta:.2f}", style=color)
+        return self._styled(f"{symbol}{delta:.2f}", color)
 
-    def _format_samples_percent(self, comparison: ComparisonResult) -> Text:
+    def _format_samples_percent(self, comparison: ComparisonResult) -> RenderableType:
         """Format samples per second percent change with color."""
         if comparison.samples_per_sec_percent_change is None:
-            return Text("N/A", style=self.colors.NEUTRAL)
+            return self._na_text
 
         percent = comparison.samples_per_sec_percent_change
         color = self._get_delta_color(percent, inverse=False)
         symbol = "+" if percent >= 0 else ""
-        return Text(f"{symbol}{percent:.1f}%", style=color)
+        return self._styled(f"{symbol}{percent:.1f}%", color)
 
-    def _format_device_delta(self, comparison: ComparisonResult) -> Text:
+    def _format_device_delta(self, comparison: ComparisonResult) -> RenderableType:
         """Format device perf delta with color (ms)."""
         if comparison.device_perf_delta_ms is None:
-            return Text("N/A", style=self.colors.NEUTRAL)
+            return self._na_text
 
         delta_ms = comparison.device_perf_delta_ms
         color = self._get_delta_color(delta_ms, inverse=True)  # Lower is better
         symbol = "+" if delta_ms >= 0 else ""
-        return Text(f"{symbol}{delta_ms:.2f}", style=color)
+        return self._styled(f"{symbol}{delta_ms:.2f}", color)
 
-    def _format_device_percent(self, comparison: ComparisonResult) -> Text:
+    def _format_device_percent(self, comparison: ComparisonResult) -> RenderableType:
         """Format device perf percent change with color."""
         if comparison.device_perf_percent_change is None:
-            return Text("N/A", style=self.colors.NEUTRAL)
+            return self._na_text
 
         percent = comparison.device_perf_percent_change
         color = self._get_delta_color(percent, inverse=True)  # Lower is better
         symbol = "+" if percent >= 0 else ""
-        return Text(f"{symbol}{percent:.1f}%", style=color)
+        return self._styled(f"{symbol}{percent:.1f}%", color)
 
-    def _format_result(self, comparison: ComparisonResult) -> Text:
+    def _format_result(self, comparison: ComparisonResult) -> RenderableType:
         """Format overall result indicator."""
         if comparison.is_regression:
-            return Text("REGRESSION", style=self.colors.RESULT_REGRESSION)
+            return self._regression_text
         elif comparison.is_improvement:
-            return Text("IMPROVEMENT", style=self.colors.RESULT_IMPROVEMENT)
+            return self._improvement_text
         elif comparison.baseline is None:
-            return Text("NEW", style=self.colors.RESULT_NEW)
+            return self._new_text
         elif comparison.current is None:
-            return Text("REMOVED", style=self.colors.RESULT_REMOVED)
+            return self._removed_text
         else:
-            return Text("NEUTRAL", style=self.colors.RESULT_NEUTRAL)
+            return self._neutral_text
 
     def _format_error(self, job: JobResult) -> str:
         """Format error message."""
@@ -331,62 +382,70 @@ class TableFormatter:
             parts.append(f"Step: {job.failed_step}")
         if job.error_message:
             # Truncate long error messages
-            max_len = 60
             error = job.error_message
-            error_text = error[:max_len] + "..." if len(error) > max_len else error
-            parts.append(error_text)
+            parts.append(
+                error if len(error) <= _MAX_ERROR_LEN else f"{error[:_MAX_ERROR_LEN]}..."
+            )
         return " | ".join(parts) if parts else ""
 
     def _get_delta_color(self, value: float, inverse: bool = False) -> str:
         """Get color for delta value."""
         if abs(value) < 0.01:  # Negligible change
-            return self.colors.UNCHANGED
+            return self._unchanged_style
 
         # For inverse metrics (like duration), lower is better
         if inverse:
             value = -value
 
         if value > 0:
-            return self.colors.IMPROVEMENT
+            return self._improvement_style
         else:
-            return self.colors.REGRESSION
+            return self._regression_style
 
     def _colorize_status(self, status: str, conclusion: Optional[str]) -> Text:
         """Colorize workflow status."""
-        if status == "completed":
-            if conclusion == "success":
-                return Text(f"{status} ({conclusion})", style=self.colors.SUCCESS)
-            elif conclusion == "failure":
-                return Text(f"{status} ({conclusion})", style=self.colors.FAILURE)
-        return Text(f"{status} ({conclusion or 'unknown'})", style=self.colors.PENDING)
-
-    def _print_summary(self, report: WorkflowReport) -> None:
-        """Print summary statistics."""
-        total = len(report.jobs)
-        self.console.print(f"\n[bold]Summary:[/bold]")
-        self.console.print(f"  Total jobs: {total}")
-        self.console.print(f"  [{self.colors.SUCCESS}]Success: {report.success_count}[/{self.colors.SUCCESS}]")
-        self.console.print(f"  [{self.colors.FAILURE}]Failed: {report.failure_count}[/{self.colors.FAILURE}]")
-        self.console.print(f"  [{self.colors.SKIPPED}]Skipped: {report.skipped_count}[/{self.colors.SKIPPED}]")
-
-    def _print_comparison_summary(self, comparisons: List[ComparisonResult]) -> None:
-        """Print comparison summary."""
-        regressions = sum(1 for c in comparisons if c.is_regression)
-        improvements = sum(1 for c in comparisons if c.is_improvement)
-        neutral = sum(
-            1
-            for c in comparisons
-            if not c.is_regression and not c.is_improvement and c.baseline and c.current
+        style = self.colors.PENDING
+        if status == "completed" and conclusion:
+            style = self._run_conclusion_styles.get(conclusion, style)
+        return Text(f"{status} ({conclusion or 'unknown'})", style=style)
+
+    def _format_summary(self, report: WorkflowReport) -> Text:
+        """Format summary statistics."""
+        return self.console.render_str(
+            self._summary_template.format(
+                total=len(report.jobs),
+                success=report.success_count,
+                failed=report.failure_count,
+                skipped=report.skipped_count,
+            )
+        )
+
+    def _format_comparison_summary(self, comparisons: List[ComparisonResult]) -> Text:
+        """Format comparison summary."""
+        # Count everything in one pass; a job can be both a regression and
+        # an improvement (e.g. faster simulation but slower device perf)
+        regressions = improvements = neutral = new_jobs = removed_jobs = 0
+        for c in comparisons:
+            if c.baseline is None:
+                new_jobs += 1
+            elif c.current is None:
+                removed_jobs += 1
+            elif c.is_regression:
+                regressions += 1
+                improvements += c.is_improvement
+            elif c.is_improvement:
+                improvements += 1
+            else:
+                neutral += 1
+
+        summary = self._comparison_summary_template.format(
+            total=len(comparisons),
+            regressions=regressions,
+            improvements=improvements,
+            neutral=neutral,
         )
-        new_jobs = sum(1 for c in comparisons if c.baseline is None)
-        removed_jobs = sum(1 for c in comparisons if c.current is None)
-
-        self.console.print(f"\n[bold]Summary:[/bold]")
-        self.console.print(f"  Total comparisons: {len(comparisons)}")
-        self.console.print(f"  [{self.colors.RESULT_REGRESSION}]Regressions: {regressions}[/{self.colors.RESULT_REGRESSION}]")
-        self.console.print(f"  [{self.colors.RESULT_IMPROVEMENT}]Improvements: {improvements}[/{self.colors.RESULT_IMPROVEMENT}]")
-        self.console.print(f"  [{self.colors.RESULT_NEUTRAL}]Neutral: {neutral}[/{self.colors.RESULT_NEUTRAL}]")
         if new_jobs > 0:
-            self.console.print(f"  [{self.colors.RESULT_NEW}]New: {new_jobs}[/{self.colors.RESULT_NEW}]")
+            summary += self._new_jobs_template.format(new_jobs)
         if removed_jobs > 0:
-            self.console.print(f"  [{self.colors.RESULT_REMOVED}]Removed: {removed_jobs}[/{self.colors.RESULT_REMOVED}]")
+            summary += self._removed_jobs_template.format(removed_jobs)
+        return self.console.render_str(summary)
@@ -1,15 +1,51 @@
 """Parser for device performance CSV files."""
 
 import csv
+import functools
 import io
 import zipfile
-from pathlib import Path
-from typing import Optional
+from operator import attrgetter
+from typing import BinaryIO, Iterator, List, Optional, TextIO, Tuple, Union
 
 from ..processors.models import DevicePerfMetrics, StagePerfMetrics
-from ..utils.errors import ParseError
+from ..utils.errors import MissingColumnsError, ParseError
 from ..config import CSV_REQUIRED_COLUMNS, CSV_DURATION_COLUMN
 
+# Cell values (lowercased) that mark a filter flag as set
+_TRUE_VALUES = frozenset({"true", "1", "yes", "t"})
+# Exact cell spellings decided without normalizing; anything else falls back
+# to a strip().lower() lookup in _TRUE_VALUES
+_TRUE_CELLS = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "t", "T"})
+_FALSE_CELLS = frozenset({"", "false", "False", "FALSE", "0", "no", "No", "NO", "f", "F"})
+
+
+@functools.lru_cache(maxsize=16)
+def _column_indices(header: Tuple[str, ...]) -> Tuple[int, int, int]:
+    """
+    Validate a CSV header and resolve the columns the parser reads.
+
+    CSVs of one artifact share their header, so this is cached per header
+    and the schema is checked once rather than for every file.
+
+    Args:
+        header: Column names from the first CSV row
+
+    Returns:
+        Indices of the duration, const-eval and layout-conversion columns
+
+    Raises:
+        MissingColumnsError: If required columns are missing
+    """
+    missing_cols = [col for col in CSV_REQUIRED_COLUMNS if col not in header]
+    if missing_cols:
+        raise MissingColumnsError(f"Missing required columns: {missing_cols}")
+
+    return (
+        header.index(CSV_DURATION_COLUMN),
+        header.index("CONST_EVAL_OP"),
+        header.index("INPUT_LAYOUT_CONVERSION_OP"),
+    )
+
 
 class CSVParser:
     """Parser for device performance CSV files."""
@@ -33,153 +69,193 @@ class CSVParser:
         Returns:
             DevicePerfMetrics with calculated values
         """
-        try:
-            reader = csv.DictReader(io.StringIO(csv_content))
+        return self._parse_csv_file(io.StringIO(csv_content))
 
-            # Verify required columns exist
-            fieldnames = reader.fieldnames or []
-            missing_cols = [
-                col for col in CSV_REQUIRED_COLUMNS if col not in fieldnames
-            ]
-            if missing_cols:
-                raise ParseError(f"Missing required columns: {missing_cols}")
-
-            total_duration = 0.0
-            filtered_count = 0
+    def _parse_csv_file(self, csv_file: TextIO) -> DevicePerfMetrics:
+        """
+        Parse device performance CSV rows from a text stream.
 
-            for row in reader:
-                # Apply filters - skip rows where either flag is true
-                if self._should_filter_row(row):
-                    continue
+        Filters out rows where CONST_EVAL_OP or INPUT_LAYOUT_CONVERSION_OP
+        is true, then sums DEVICE KERNEL DURATION [ns] over the rest.
 
-                # Extract duration
-                duration = self._parse_duration(row.get(CSV_DURATION_COLUMN, "0"))
-                if duration is None:
-                    continue
+        Rows are read positionally with the column indices resolved once
+        from the header, so no dict is built per row.
 
-                total_duration += duration
-                filtered_count += 1
+        Errors reading the stream itself (e.g. decoding) are not caught.
 
-            avg_duration = total_duration / filtered_count if filtered_count > 0 else 0.0
+        Args:
+            csv_file: Text stream positioned at the CSV header
 
-            return DevicePerfMetrics(
-                total_op_duration_ns=total_duration,
-                filtered_op_count=filtered_count,
-                avg_op_duration_ns=avg_duration,
-            )
+        Returns:
+            DevicePerfMetrics with calculated values
 
-        except ParseError:
-            raise
-        except Exception as e:
+        Raises:
+            MissingColumnsError: If required columns are missing
+            ParseError: If the CSV is malformed
+        """
+        try:
+            reader = csv.reader(csv_file)
+            header = next(reader, None) or []
+            return self._parse_rows(reader, _column_indices(tuple(header)))
+        except csv.Error as e:
             raise ParseError(f"Failed to parse device perf CSV: {e}")
 
-    def _should_filter_row(self, row: dict) -> bool:
+    def _parse_rows(
+        self, reader: Iterator[List[str]], indices: Tuple[int, int, int]
+    ) -> DevicePerfMetrics:
         """
-        Check if row should be filtered based on flags.
+        Sum the durations of all unfiltered rows.
 
         Args:
-            row: CSV row as dictionary
+            reader: csv.reader positioned after the header
+            indices: Duration, const-eval and layout-conversion column indices
 
         Returns:
-            True if row should be excluded
+            DevicePerfMetrics with calculated values
         """
-        const_eval = self._parse_bool(row.get("CONST_EVAL_OP", "false"))
-        layout_conversion = self._parse_bool(
-            row.get("INPUT_LAYOUT_CONVERSION_OP", "false")
+        duration_idx, const_eval_idx, layout_idx = indices
+        min_len = max(indices) + 1
+
+        total_duration = 0.0
+        filtered_count = 0
+
+        for row in reader:
+            # Missing trailing cells read as empty (like DictReader)
+            if len(row) < min_len:
+                row += [""] * (min_len - len(row))
+
+            # Apply filters - skip rows where either flag is true
+            const_eval = row[const_eval_idx]
+            if const_eval in _TRUE_CELLS or (
+                const_eval not in _FALSE_CELLS
+                and const_eval.strip().lower() in _TRUE_VALUES
+            ):
+                continue
+            layout = row[layout_idx]
+            if layout in _TRUE_CELLS or (
+                layout not in _FALSE_CELLS and layout.strip().lower() in _TRUE_VALUES
+            ):
+                continue
+
+            # Extract duration; empty cells are skipped without raising
+            # (float() tolerates surrounding whitespace)
+            value = row[duration_idx]
+            if not value:
+                continue
+            try:
+                duration = float(value)
+            except ValueError:
+                continue
+
+            total_duration += duration
+            filtered_count += 1
+
+        avg_duration = total_duration / filtered_count if filtered_count > 0 else 0.0
+
+        return DevicePerfMetrics(
+            total_op_duration_ns=total_duration,
+            filtered_op_count=filtered_count,
+            avg_op_duration_ns=avg_duration,
         )
-        # Exclude if either flag is true
-        return const_eval or layout_conversion
 
-    def _parse_duration(self, value: str) -> Optional[float]:
-        """Parse duration value from CSV."""
-        try:
-            return float(value.strip())
-        except (ValueError, AttributeError):
-            return None
-
-    def _parse_bool(self, value: str) -> bool:
-        """Parse boolean value from CSV."""
-        if not value:
-            return False
-        value_lower = str(value).strip().lower()
-        return value_lower in ("true", "1", "yes", "t")
-
-    def extract_csvs_from_artifact_zip(self, zip_path: str) -> list:
+    def extract_csvs_from_artifact_zip(self, zip_path: Union[str, BinaryIO]) -> list:
         """
         Extract ALL CSV files from artifact ZIP.
 
         Args:
-            zip_path: Path to the ZIP file
+            zip_path: Path to the ZIP file, or a seekable binary file object
 
         Returns:
             List of tuples (filename, content)
         """
         try:
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                # Find CSV files in ZIP
-                csv_files = [f for f in zip_ref.namelist() if f.endswith(".csv")]
+                # Find CSV files in ZIP, sorted for consistent ordering
+                csv_files = sorted(f for f in zip_ref.namelist() if f.endswith(".csv"))
                 if not csv_files:
                     raise ParseError("No CSV file found in artifact ZIP")
 
-                # Sort by filename for consistent ordering
-                csv_files.sort()
-
-                # Read ALL CSV files with their names
-                csv_data = []
-                for csv_file_name in csv_files:
-                    with zip_ref.open(csv_file_name) as csv_file:
-                        content = csv_file.read().decode("utf-8")
-                        csv_data.append((csv_file_name, content))
-
-                return csv_data
+                return [(name, zip_ref.read(name).decode("utf-8")) for name in csv_files]
 
         except zipfile.BadZipFile as e:
             raise ParseError(f"Invalid ZIP file: {e}")
         except Exception as e:
             raise ParseError(f"Failed to extract CSV from ZIP: {e}")
 
-    def parse_all_csvs_from_zip(self, zip_path: str) -> DevicePerfMetrics:
+    def parse_all_csvs_from_bytes(self, data: bytes) -> DevicePerfMetrics:
+        """
+        Parse ALL CSV files from in-memory artifact ZIP content.
+
+        Args:
+            data: ZIP file content
+
+        Returns:
+            Combined DevicePerfMetrics from all CSV files with per-stage breakdown
+        """
+        return self.parse_all_csvs_from_zip(io.BytesIO(data))
+
+    def parse_all_csvs_from_zip(self, zip_path: Union[str, BinaryIO]) -> DevicePerfMetrics:
         """
         Parse ALL CSV files from artifact ZIP and combine metrics.
 
         Skips empty CSV files and tracks per-stage metrics.
 
         Args:
-            zip_path: Path to the ZIP file
+            zip_path: Path to the ZIP file, or a seekable binary file object
 
         Returns:
             Combined DevicePerfMetrics from all CSV files with per-stage breakdown
         """
-        csv_data = self.extract_csvs_from_artifact_zip(zip_path)
-
         total_duration = 0.0
         total_count = 0
         stages = []
         stage_num = 1
 
-        for filename, csv_content in csv_data:
-            try:
-                metrics = self.parse_device_perf_csv(csv_content)
+        try:
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                # Find CSV files in ZIP, sorted for consistent ordering
+                csv_members = sorted(
+                    (info for info in zip_ref.infolist() if info.filename.endswith(".csv")),
+                    key=attrgetter("filename"),
+                )
+                if not csv_members:
+                    raise ParseError("No CSV file found in artifact ZIP")
 
-                # Skip empty CSVs (no valid ops after filtering)
-                if metrics.filtered_op_count == 0:
-                    continue
+                # Empty members have no header and would be skipped anyway, so
+                # they are not opened at all; nothing else is decompressed
+                csv_members = [info for info in csv_members if info.file_size]
 
-                # Track per-stage metrics
-                stage = StagePerfMetrics(
-                    stage_name=f"Stage {stage_num}",
-                    duration_ns=metrics.total_op_duration_ns,
-                    op_count=metrics.filtered_op_count,
-                )
-                stages.append(stage)
-                stage_num += 1
+                for info in csv_members:
+                    metrics = self._parse_zip_member(zip_ref, info)
 
-                total_duration += metrics.total_op_duration_ns
-                total_count += metrics.filtered_op_count
+                    # Skip CSVs that are malformed or lack required columns
+                    if metrics is None:
+                        continue
 
-            except ParseError:
-                # Skip CSVs that don't have required columns
-                continue
+                    # Skip empty CSVs (no valid ops after filtering)
+                    if metrics.filtered_op_count == 0:
+                        continue
+
+                    # Track per-stage metrics
+                    stage = StagePerfMetrics(
+                        stage_name=f"Stage {stage_num}",
+                        duration_ns=metrics.total_op_duration_ns,
+                        op_count=metrics.filtered_op_count,
+                    )
+                    stages.append(stage)
+                    stage_num += 1
+
+                    total_duration += metrics.total_op_duration_ns
+                    total_count += metrics.filtered_op_count
+
+        except zipfile.BadZipFile as e:
+            raise ParseError(f"Invalid ZIP file: {e}")
+        except ParseError:
+            raise
+        except Exception as e:
+            # Undecodable or corrupt members fail the whole artifact rather
+            # than silently dropping a stage from the total
+            raise ParseError(f"Failed to extract CSV from ZIP: {e}")
 
         if total_count == 0:
             raise ParseError("No valid device perf data found in any CSV file")
@@ -192,3 +268,26 @@ class CSVParser:
             avg_op_duration_ns=avg_duration,
             stages=stages,
         )
+
+    def _parse_zip_member(
+        self, zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo
+    ) -> Optional[DevicePerfMetrics]:
+        """
+        Parse one CSV member of an artifact ZIP, streaming its rows.
+
+        Args:
+            zip_ref: Open artifact ZIP
+            member: ZIP entry of the CSV file
+
+        Returns:
+            DevicePerfMetrics, or None if the CSV lacks required columns or
+            is malformed (e.g. a field over the csv module's size limit)
+        """
+        with zip_ref.open(member) as raw_file:
+            csv_file = io.TextIOWrapper(raw_file, encoding="utf-8", newline="")
+            try:
+                return self._parse_csv_file(csv_file)
+            except ParseError:
+                # Only this CSV is skipped; decoding and decompression errors
+                # still propagate and fail the whole artifact
+                return None
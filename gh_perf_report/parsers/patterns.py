@@ -4,6 +4,10 @@
 # Matches: "Sample per second: 12345.67" or "Samples per second: 12345.67"
 SAMPLES_PER_SECOND_PATTERN = r"Sample[s]?\s+per\s+second:\s*(\d+\.?\d*)"
 
+# Literal text every samples-per-second match contains (lowercased), used to
+# skip the regex scan on logs that cannot match
+SAMPLES_PER_SECOND_SENTINEL = "second:"
+
 # Optional metric patterns
 EXECUTION_TIME_PATTERN = r"Total\s+execution\s+time:\s*(\d+\.?\d*)"
 TOTAL_SAMPLES_PATTERN = r"Total\s+samples:\s*(\d+)"
@@ -26,6 +30,9 @@ ERROR_PATTERNS = [
     r"Traceback.*?(?:Error|Exception):\s*(.+?)(?:\n|$)",
 ]
 
+# Literal text at least one of which every error pattern match contains
+ERROR_SENTINELS = ("Error:", "ERROR:", "FAILED:", "Exception:")
+
 # All patterns collected
 PERF_PATTERNS = {
     "samples_per_second": SAMPLES_PER_SECOND_PATTERN,
@@ -1,9 +1,41 @@
 """Compare two workflow runs and identify differences."""
 
-from typing import List, Optional
+import math
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 from .models import WorkflowReport, JobResult, ComparisonResult, JobConclusion
 from ..config import REGRESSION_THRESHOLD, IMPROVEMENT_THRESHOLD
+from ..utils.job_patterns import JOB_NAME_TT_MODEL_RE, JOB_NAME_PERF_BENCHMARK_RE
+
+# Thresholds as percentages; REGRESSION_THRESHOLD is negative (a decrease)
+_REGRESSION_PCT = REGRESSION_THRESHOLD * 100
+_IMPROVEMENT_PCT = IMPROVEMENT_THRESHOLD * 100
+# Device perf duration is lower-is-better, so its thresholds flip sign
+_DURATION_REGRESSION_PCT = -_REGRESSION_PCT
+_DURATION_IMPROVEMENT_PCT = -_IMPROVEMENT_PCT
+
+# Conclusions of jobs that did not run their benchmark
+_NOT_RUN_CONCLUSIONS = frozenset({JobConclusion.SKIPPED, JobConclusion.CANCELLED})
+
+
+def _percent_change(baseline: float, current: float) -> Tuple[float, float]:
+    """
+    Compute the change of a metric between two runs.
+
+    Args:
+        baseline: Baseline value
+        current: Current value
+
+    Returns:
+        Tuple of (delta, percent change); from a zero baseline the percent
+        change is infinite with the sign of the delta (0.0 if unchanged),
+        so thresholds still classify it
+    """
+    delta = current - baseline
+    if baseline == 0:
+        return delta, math.copysign(math.inf, delta) if delta else 0.0
+    return delta, delta / baseline * 100
 
 
 class CompareProcessor:
@@ -22,22 +54,57 @@ class CompareProcessor:
         Returns:
             List of comparison results for each job
         """
-        # Build job lookup maps by extracting model name from job name
-        baseline_jobs = {self._get_job_key(job): job for job in baseline.jobs}
-        current_jobs = {self._get_job_key(job): job for job in current.jobs}
-
-        # Get all unique job keys
-        all_job_keys = sorted(set(baseline_jobs.keys()) | set(current_jobs.keys()))
+        # Merge-join the two runs' jobs ordered by job key; the output comes
+        # out ordered by key as well
+        baseline_jobs = self._jobs_by_key(baseline.jobs)
+        current_jobs = self._jobs_by_key(current.jobs)
 
         comparisons = []
-        for job_key in all_job_keys:
-            baseline_job = baseline_jobs.get(job_key)
-            current_job = current_jobs.get(job_key)
+        i = j = 0
+        while i < len(baseline_jobs) and j < len(current_jobs):
+            baseline_key, baseline_job = baseline_jobs[i]
+            current_key, current_job = current_jobs[j]
+            if baseline_key == current_key:
+                comparisons.append(self._compare_jobs(baseline_key, baseline_job, current_job))
+                i += 1
+                j += 1
+            elif baseline_key < current_key:
+                # Removed job
+                comparisons.append(ComparisonResult(job_name=baseline_key, baseline=baseline_job))
+                i += 1
+            else:
+                # New job
+                comparisons.append(ComparisonResult(job_name=current_key, current=current_job))
+                j += 1
+
+        comparisons.extend(
+            ComparisonResult(job_name=job_key, baseline=job) for job_key, job in baseline_jobs[i:]
+        )
+        comparisons.extend(
+            ComparisonResult(job_name=job_key, current=job) for job_key, job in current_jobs[j:]
+        )
+        return comparisons
 
-            comparison = self._compare_jobs(job_key, baseline_job, current_job)
-            comparisons.append(comparison)
+    def _jobs_by_key(self, jobs: List[JobResult]) -> List[Tuple[str, JobResult]]:
+        """
+        Pair jobs with their comparison key, ordered by key.
 
-        return comparisons
+        If several jobs share a key, the last one wins.
+
+        Args:
+            jobs: Jobs of one workflow report
+
+        Returns:
+            List of (job_key, job) with unique keys, sorted by key
+        """
+        keyed = sorted(((self._get_job_key(job), job) for job in jobs), key=itemgetter(0))
+        unique: List[Tuple[str, JobResult]] = []
+        for pair in keyed:
+            if unique and unique[-1][0] == pair[0]:
+                unique[-1] = pair
+            else:
+                unique.append(pair)
+        return unique
 
     def _get_job_key(self, job: JobResult) -> str:
         """
@@ -49,17 +116,13 @@ class CompareProcessor:
         job_name = job.job_name
 
         # Extract the model identifier (e.g., "tt-xla-efficientnet" from full job name)
-        # Pattern: "run-n150-perf-benchmarks / tt-xla-model-name (n150-perf, 12, 128) benchmark"
-        import re
-
-        match = re.search(r"(tt-(?:xla|forge)-[a-zA-Z0-9_-]+)", job_name, re.IGNORECASE)
+        match = JOB_NAME_TT_MODEL_RE.search(job_name)
         if match:
-            return match.group(1).lower()
+            return match.group(0).lower()
 
-        # New tt-xla format: "run-n150-perf-benchmarks / perf model_name (n150-perf)"
         # Include benchmark type (n150-perf, p150, llmbox) in key to avoid
         # cross-hardware collisions when comparing runs.
-        match = re.search(r"/\s*perf\s+([a-zA-Z0-9_][a-zA-Z0-9_.-]*)\s*\(([^)]+)\)", job_name, re.IGNORECASE)
+        match = JOB_NAME_PERF_BENCHMARK_RE.search(job_name)
         if match:
             model, bench_type = match.group(1), match.group(2)
             return f"{bench_type}/{model}".lower()
@@ -87,95 +150,76 @@ class CompareProcessor:
         # Check status changes
         comparison.status_changed = baseline.conclusion != current.conclusion
 
+        # Jobs that did not run in either run have no metrics to compare
+        if not comparison.status_changed and baseline.conclusion in _NOT_RUN_CONCLUSIONS:
+            return comparison
+
         # Compare simulation metrics (samples per second)
-        if (
-            baseline.simulation_metrics
-            and current.simulation_metrics
-            and baseline.simulation_metrics.samples_per_second
-            and current.simulation_metrics.samples_per_second
-        ):
-            baseline_sps = baseline.simulation_metrics.samples_per_second
-            current_sps = current.simulation_metrics.samples_per_second
-
-            comparison.samples_per_sec_delta = current_sps - baseline_sps
-            if baseline_sps != 0:
-                comparison.samples_per_sec_percent_change = (
-                    (current_sps - baseline_sps) / baseline_sps * 100
-                )
+        if baseline.simulation_metrics and current.simulation_metrics:
+            (
+                comparison.samples_per_sec_delta,
+                comparison.samples_per_sec_percent_change,
+            ) = _percent_change(
+                baseline.simulation_metrics.samples_per_second,
+                current.simulation_metrics.samples_per_second,
+            )
 
         # Compare device perf metrics
         if baseline.device_perf_metrics and current.device_perf_metrics:
-            baseline_duration = baseline.device_perf_metrics.total_op_duration_ns
-            current_duration = current.device_perf_metrics.total_op_duration_ns
-
-            comparison.device_perf_delta_ns = current_duration - baseline_duration
-            if baseline_duration != 0:
-                comparison.device_perf_percent_change = (
-                    (current_duration - baseline_duration) / baseline_duration * 100
-                )
+            (
+                comparison.device_perf_delta_ns,
+                comparison.device_perf_percent_change,
+            ) = _percent_change(
+                baseline.device_perf_metrics.total_op_duration_ns,
+                current.device_perf_metrics.total_op_duration_ns,
+            )
+            comparison.device_perf_delta_ms = comparison.device_perf_delta_ns / 1_000_000
 
         # Determine if regression or improvement
-        comparison.is_regression = self._is_regression(comparison)
-        comparison.is_improvement = self._is_improvement(comparison)
+        comparison.is_regression, comparison.is_improvement = self._classify(comparison)
 
         return comparison
 
-    def _is_regression(self, comparison: ComparisonResult) -> bool:
+    def _classify(self, comparison: ComparisonResult) -> Tuple[bool, bool]:
         """
-        Check if comparison shows a performance regression.
+        Check if comparison shows a performance regression and/or improvement.
 
         Regression means:
         - Status changed from success to failure
         - Samples per second decreased by more than threshold
         - Device perf duration increased by more than threshold (higher is worse)
-        """
-        # Status regression: success -> failure
-        if comparison.baseline and comparison.current:
-            if (
-                comparison.baseline.conclusion == JobConclusion.SUCCESS
-                and comparison.current.conclusion == JobConclusion.FAILURE
-            ):
-                return True
-
-        # Performance regression: significant decrease in samples/sec
-        if comparison.samples_per_sec_percent_change is not None:
-            if comparison.samples_per_sec_percent_change < REGRESSION_THRESHOLD * 100:
-                return True
-
-        # Device perf regression: significant increase in duration (lower is better)
-        if comparison.device_perf_percent_change is not None:
-            if comparison.device_perf_percent_change > -REGRESSION_THRESHOLD * 100:
-                # This means duration increased by more than threshold
-                if comparison.device_perf_percent_change > abs(REGRESSION_THRESHOLD * 100):
-                    return True
-
-        return False
-
-    def _is_improvement(self, comparison: ComparisonResult) -> bool:
-        """
-        Check if comparison shows a performance improvement.
 
         Improvement means:
         - Status changed from failure to success
         - Samples per second increased by more than threshold
         - Device perf duration decreased by more than threshold (lower is better)
+
+        Both can hold at once, e.g. faster simulation but slower device perf.
+
+        Returns:
+            Tuple of (is_regression, is_improvement)
         """
-        # Status improvement: failure -> success
+        is_regression = is_improvement = False
+
+        # Status transitions
         if comparison.baseline and comparison.current:
-            if (
-                comparison.baseline.conclusion == JobConclusion.FAILURE
-                and comparison.current.conclusion == JobConclusion.SUCCESS
-            ):
-                return True
-
-        # Performance improvement: significant increase in samples/sec
-        if comparison.samples_per_sec_percent_change is not None:
-            if comparison.samples_per_sec_percent_change > IMPROVEMENT_THRESHOLD * 100:
-                return True
-
-        # Device perf improvement: significant decrease in duration
-        if comparison.device_perf_percent_change is not None:
-            if comparison.device_perf_percent_change < -IMPROVEMENT_THRESHOLD * 100:
-                return True
-
-        return False
+            baseline_conclusion = comparison.baseline.conclusion
+            current_conclusion = comparison.current.conclusion
+            if baseline_conclusion == JobConclusion.SUCCESS:
+                is_regression = current_conclusion == JobConclusion.FAILURE
+            elif baseline_conclusion == JobConclusion.FAILURE:
+                is_improvement = current_conclusion == JobConclusion.SUCCESS
+
+        # Samples/sec: higher is better
+        sps_change = comparison.samples_per_sec_percent_change
+        if sps_change is not None:
+            is_regression = is_regression or sps_change < _REGRESSION_PCT
+            is_improvement = is_improvement or sps_change > _IMPROVEMENT_PCT
+
+        # Device perf duration: lower is better
+        device_change = comparison.device_perf_percent_change
+        if device_change is not None:
+            is_regression = is_regression or device_change > _DURATION_REGRESSION_PCT
+            is_improvement = is_improvement or device_change < _DURATION_IMPROVEMENT_PCT
+
+        return is_regression, is_improvement
@@ -1,6 +1,8 @@
 """Data models for performance reports."""
 
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, List, Dict
 from enum import Enum
 
@@ -23,7 +25,7 @@ class JobConclusion(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationMetrics:
     """Metrics from Step 10: Run Perf Benchmark."""
 
@@ -35,7 +37,7 @@ class SimulationMetrics:
     metadata: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StagePerfMetrics:
     """Metrics for a single stage (one CSV file)."""
 
@@ -49,7 +51,7 @@ class StagePerfMetrics:
         return self.duration_ns / 1_000_000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DevicePerfMetrics:
     """Metrics from Device Perf CSV artifacts."""
 
@@ -69,7 +71,7 @@ class DevicePerfMetrics:
         return len(self.stages)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResult:
     """Complete job performance data."""
 
@@ -96,23 +98,48 @@ class WorkflowReport:
     conclusion: str
     jobs: List[JobResult] = field(default_factory=list)
 
+    @cached_property
+    def conclusion_counts(self) -> Counter:
+        """
+        Number of jobs per conclusion, counted in one pass on first access.
+
+        Computed once, so jobs must not be changed after it is read.
+        """
+        return Counter(j.conclusion for j in self.jobs)
+
+    @cached_property
+    def max_stages(self) -> int:
+        """
+        Most device perf stages of any job, computed on first access.
+
+        Like conclusion_counts, jobs must not be changed after it is read.
+        """
+        return max(
+            (
+                len(j.device_perf_metrics.stages)
+                for j in self.jobs
+                if j.device_perf_metrics
+            ),
+            default=0,
+        )
+
     @property
     def success_count(self) -> int:
         """Count of successful jobs."""
-        return sum(1 for j in self.jobs if j.conclusion == JobConclusion.SUCCESS)
+        return self.conclusion_counts[JobConclusion.SUCCESS]
 
     @property
     def failure_count(self) -> int:
         """Count of failed jobs."""
-        return sum(1 for j in self.jobs if j.conclusion == JobConclusion.FAILURE)
+        return self.conclusion_counts[JobConclusion.FAILURE]
 
     @property
     def skipped_count(self) -> int:
         """Count of skipped jobs."""
-        return sum(1 for j in self.jobs if j.conclusion == JobConclusion.SKIPPED)
+        return self.conclusion_counts[JobConclusion.SKIPPED]
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Comparison between two job results."""
 
@@ -122,14 +149,9 @@ class ComparisonResult:
     samples_per_sec_delta: Optional[float] = None
     samples_per_sec_percent_change: Optional[float] = None
     device_perf_delta_ns: Optional[float] = None
+    # Set together with device_perf_delta_ns
+    device_perf_delta_ms: Optional[float] = None
     device_perf_percent_change: Optional[float] = None
     status_changed: bool = False
     is_regression: bool = False
     is_improvement: bool = False
-
-    @property
-    def device_perf_delta_ms(self) -> Optional[float]:
-        """Device perf delta in milliseconds."""
-        if self.device_perf_delta_ns is not None:
-            return self.device_perf_delta_ns / 1_000_000
-        return None
@@ -1,9 +1,9 @@
 """Process workflow runs and extract performance metrics."""
 
 import concurrent.futures
-import tempfile
-from pathlib import Path
-from typing import List, Optional
+import re
+from operator import itemgetter
+from typing import Dict, List, Optional
 
 from ..api.github_client import GitHubClient
 from ..parsers.log_parser import LogParser
@@ -13,11 +13,17 @@ from .models import (
     JobResult,
     JobStatus,
     JobConclusion,
-    DevicePerfMetrics,
 )
 from ..utils.errors import ProcessingError
 from ..config import BENCHMARK_JOB_PATTERNS, DEFAULT_MAX_WORKERS
 
+# Any of the benchmark job name patterns, matched in one scan
+_RE_BENCHMARK_JOB = re.compile("|".join(re.escape(p) for p in BENCHMARK_JOB_PATTERNS))
+
+# Enum members by API value, to avoid Enum value lookups per job
+_STATUS_BY_VALUE = {status.value: status for status in JobStatus}
+_CONCLUSION_BY_VALUE = {conclusion.value: conclusion for conclusion in JobConclusion}
+
 
 class ReportProcessor:
     """Process workflow run and extract performance metrics."""
@@ -48,9 +54,8 @@ class ReportProcessor:
         Returns:
             Complete workflow report with all job metrics
         """
-        # Fetch workflow run details
-        run_data = self.github.get_workflow_run(owner, repo, run_id)
-        jobs_data = self.github.get_workflow_jobs(owner, repo, run_id)
+        # Fetch workflow run details, jobs and artifacts in one go
+        run_data, jobs_data, _ = self.github.get_run_bundle(owner, repo, run_id)
 
         # Filter benchmark jobs
         benchmark_jobs = [job for job in jobs_data if self._is_benchmark_job(job["name"])]
@@ -76,7 +81,7 @@ class ReportProcessor:
 
     def _is_benchmark_job(self, job_name: str) -> bool:
         """Check if job is a benchmark job."""
-        return any(pattern in job_name for pattern in BENCHMARK_JOB_PATTERNS)
+        return _RE_BENCHMARK_JOB.search(job_name) is not None
 
     def _process_jobs_parallel(
         self,
@@ -88,35 +93,41 @@ class ReportProcessor:
         artifact_cache: dict,
     ) -> List[JobResult]:
         """Process multiple jobs in parallel."""
+        # Jobs are ordered by name up front and each result is stored at its
+        # job's position, so no sorting is needed afterwards
+        jobs = sorted(jobs, key=itemgetter("name"))
+        results: List[Optional[JobResult]] = [None] * len(jobs)
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_job = {
-                executor.submit(
-                    self._process_single_job, owner, repo, run_id, job, artifact_cache
-                ): job
-                for job in jobs
-            }
-
-            results = []
-            for future in concurrent.futures.as_completed(future_to_job):
-                job = future_to_job[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    # Create error result for failed processing
-                    results.append(
-                        JobResult(
-                            job_id=job["id"],
-                            job_name=job["name"],
-                            status=JobStatus.COMPLETED,
-                            conclusion=JobConclusion.FAILURE,
-                            error_message=f"Processing error: {str(e)}",
-                        )
+            # Submit jobs in a bounded window rather than all at once, and
+            # handle each batch of finished jobs as soon as it lands
+            window = 2 * max_workers
+            next_index = 0
+            pending: Dict[concurrent.futures.Future[JobResult], int] = {}
+            while pending or next_index < len(jobs):
+                while next_index < len(jobs) and len(pending) < window:
+                    future = executor.submit(
+                        self._process_single_job,
+                        owner,
+                        repo,
+                        run_id,
+                        jobs[next_index],
+                        artifact_cache,
                     )
-
-            # Sort by job name for consistent ordering
-            results.sort(key=lambda x: x.job_name)
-            return results
+                    pending[future] = next_index
+                    next_index += 1
+
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = _error_result(jobs[index], e)
+
+        # Every slot is filled once all futures are done
+        return [result for result in results if result is not None]
 
     def _process_single_job(
         self, owner: str, repo: str, run_id: int, job_data: dict, artifact_cache: dict
@@ -124,13 +135,12 @@ class ReportProcessor:
         """Process a single job and extract all metrics."""
         job_id = job_data["id"]
         job_name = job_data["name"]
-        status = JobStatus(job_data["status"])
+        # Unknown statuses fall through to JobStatus() to raise its ValueError;
+        # unknown conclusions are treated as missing
+        status = _STATUS_BY_VALUE.get(job_data["status"]) or JobStatus(job_data["status"])
         conclusion = None
         if job_data.get("conclusion"):
-            try:
-                conclusion = JobConclusion(job_data["conclusion"])
-            except ValueError:
-                conclusion = None
+            conclusion = _CONCLUSION_BY_VALUE.get(job_data["conclusion"])
 
         # Initialize result
         result = JobResult(
@@ -144,11 +154,9 @@ class ReportProcessor:
         if status != JobStatus.COMPLETED:
             return result
 
-        # If job failed, extract error information
+        # If job failed, record the failed step
         if conclusion == JobConclusion.FAILURE:
-            failed_step, error_msg = self._extract_failure_info(job_data)
-            result.failed_step = failed_step
-            result.error_message = error_msg
+            result.failed_step, _ = _extract_failure_info(job_data)
 
         # Extract simulation metrics from logs (Step 10)
         try:
@@ -165,9 +173,13 @@ class ReportProcessor:
 
         # Extract device perf metrics from artifacts (Step 19)
         try:
-            result.device_perf_metrics = self._extract_device_perf_metrics(
+            # Find device-perf artifact by job name (handles workflow re-runs)
+            artifact = self.github.find_device_perf_artifact_by_job_name(
                 owner, repo, run_id, job_name, artifact_cache
             )
+            if artifact:
+                data = self.github.download_artifact_stream(owner, repo, artifact["id"])
+                result.device_perf_metrics = self.csv_parser.parse_all_csvs_from_bytes(data)
         except Exception as e:
             # Don't overwrite existing error messages
             if not result.error_message:
@@ -175,45 +187,30 @@ class ReportProcessor:
 
         return result
 
-    def _extract_failure_info(self, job_data: dict) -> tuple:
-        """
-        Extract failed step and error message from job data.
-
-        Args:
-            job_data: Job data from API
-
-        Returns:
-            Tuple of (failed_step_name, error_message)
-        """
-        steps = job_data.get("steps", [])
-        for step in steps:
-            if step.get("conclusion") == "failure":
-                return step.get("name", "Unknown step"), None
-        return None, None
-
-    def _extract_device_perf_metrics(
-        self, owner: str, repo: str, run_id: int, job_name: str, artifact_cache: dict
-    ) -> Optional[DevicePerfMetrics]:
-        """Extract device performance metrics from artifact."""
-        # Find device-perf artifact by job name (handles workflow re-runs)
-        artifact = self.github.find_device_perf_artifact_by_job_name(
-            owner, repo, run_id, job_name, artifact_cache
-        )
-        if not artifact:
-            return None
-
-        # Download artifact to temp file
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
-            zip_path = tmp_file.name
-
-        try:
-            self.github.download_artifact(owner, repo, artifact["id"], zip_path)
-
-            # Parse ALL CSV files from the artifact and combine metrics
-            return self.csv_parser.parse_all_csvs_from_zip(zip_path)
-
-        finally:
-            # Cleanup temp file
-            Path(zip_path).unlink(missing_ok=True)
 
-        return None
+def _extract_failure_info(job_data: dict) -> tuple:
+    """
+    Extract failed step and error message from job data.
+
+    Args:
+        job_data: Job data from API
+
+    Returns:
+        Tuple of (failed_step_name, error_message)
+    """
+    steps = job_data.get("steps", [])
+    for step in steps:
+        if step.get("conclusion") == "failure":
+            return step.get("name", "Unknown step"), None
+    return None, None
+
+
+def _error_result(job_data: dict, error: Exception) -> JobResult:
+    """Result for a job whose processing failed."""
+    return JobResult(
+        job_id=job_data["id"],
+        job_name=job_data["name"],
+        status=JobStatus.COMPLETED,
+        conclusion=JobConclusion.FAILURE,
+        error_message=f"Processing error: {str(error)}",
+    )
@@ -5,6 +5,7 @@ from .errors import (
     GitHubAPIError,
     ArtifactNotFoundError,
     ParseError,
+    MissingColumnsError,
     ProcessingError,
 )
 
@@ -13,5 +14,6 @@ __all__ = [
     "GitHubAPIError",
     "ArtifactNotFoundError",
     "ParseError",
+    "MissingColumnsError",
     "ProcessingError",
 ]
@@ -25,6 +25,12 @@ class ParseError(GHPerfReportError):
     pass
 
 
+class MissingColumnsError(ParseError):
+    """CSV file lacks the required columns."""
+
+    pass
+
+
 class ProcessingError(GHPerfReportError):
     """Error processing workflow or job data."""
 
@@ -0,0 +1,20 @@
+"""Regex patterns for deriving model names from benchmark job names.
+
+Kept free of package imports so the API client, parsers, processors and
+formatters can all import them at module level.
+"""
+
+import re
+
+# Old format: "run-n150-perf-benchmarks / tt-xla-model-name (n150-perf, 12, 128) benchmark"
+# group(0) is the model identifier ("tt-xla-model-name"), group(1) the model name
+JOB_NAME_TT_MODEL_RE = re.compile(r"tt-(?:xla|forge)-([a-zA-Z0-9_-]+)", re.IGNORECASE)
+# New tt-xla format: "run-n150-perf-benchmarks / perf model_name (n150-perf)"
+# group(1) is the model name
+JOB_NAME_PERF_MODEL_RE = re.compile(
+    r"/\s*perf\s+([a-zA-Z0-9_][a-zA-Z0-9_.-]*)", re.IGNORECASE
+)
+# New format with its benchmark type (n150-perf, p150, llmbox) as group(2)
+JOB_NAME_PERF_BENCHMARK_RE = re.compile(
+    JOB_NAME_PERF_MODEL_RE.pattern + r"\s*\(([^)]+)\)", re.IGNORECASE
+)
@@ -9,11 +9,15 @@ setup(
     install_requires=[
         "click>=8.1.0",
         "rich>=13.0.0",
+        "requests>=2.31.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "gh-perf-report=gh_perf_report.cli:cli",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 )
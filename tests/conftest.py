@@ -0,0 +1,6 @@
+"""Shared pytest configuration."""
+
+# The parsers import the processor models, and the processors package imports
+# the parsers back; importing the processors first resolves the cycle for test
+# modules that start from a parser
+import gh_perf_report.processors  # noqa: F401
@@ -0,0 +1,147 @@
+"""Tests for comparing workflow runs."""
+
+import math
+
+from gh_perf_report.processors.compare_processor import CompareProcessor
+from gh_perf_report.processors.models import (
+    DevicePerfMetrics,
+    JobConclusion,
+    JobResult,
+    JobStatus,
+    SimulationMetrics,
+    WorkflowReport,
+)
+
+
+def _job(job_id, name, conclusion=JobConclusion.SUCCESS, sps=None, duration_ns=None):
+    return JobResult(
+        job_id=job_id,
+        job_name=name,
+        status=JobStatus.COMPLETED,
+        conclusion=conclusion,
+        simulation_metrics=(
+            SimulationMetrics(model_name="m", samples_per_second=sps)
+            if sps is not None
+            else None
+        ),
+        device_perf_metrics=(
+            DevicePerfMetrics(
+                total_op_duration_ns=duration_ns,
+                filtered_op_count=1,
+                avg_op_duration_ns=duration_ns,
+            )
+            if duration_ns is not None
+            else None
+        ),
+    )
+
+
+def _report(*jobs):
+    return WorkflowReport(
+        run_id=1,
+        repo="tenstorrent/tt-xla",
+        workflow_name="Perf",
+        branch="main",
+        created_at="2026-01-01",
+        status="completed",
+        conclusion="success",
+        jobs=list(jobs),
+    )
+
+
+def _compare(baseline_jobs, current_jobs):
+    return CompareProcessor().compare_reports(
+        _report(*baseline_jobs), _report(*current_jobs)
+    )
+
+
+def test_jobs_are_matched_by_key_and_ordered():
+    comparisons = _compare(
+        [
+            _job(1, "run / tt-xla-resnet (n150, 1, 2) benchmark", sps=100.0),
+            _job(2, "run / perf llama (n150-perf)", sps=10.0),
+            _job(3, "run / tt-forge-old", sps=1.0),
+        ],
+        [
+            _job(11, "run / perf llama (p150)", sps=10.0),
+            _job(12, "run / TT-XLA-resnet (n150, 3, 4) benchmark", sps=100.0),
+            _job(13, "run / perf llama (n150-perf)", sps=10.0),
+        ],
+    )
+
+    assert [
+        (c.job_name, c.baseline and c.baseline.job_id, c.current and c.current.job_id)
+        for c in comparisons
+    ] == [
+        ("n150-perf/llama", 2, 13),
+        ("p150/llama", None, 11),
+        ("tt-forge-old", 3, None),
+        ("tt-xla-resnet", 1, 12),
+    ]
+
+
+def test_regression_and_improvement_thresholds():
+    comparisons = _compare(
+        [
+            _job(1, "run / tt-xla-a", sps=100.0, duration_ns=1_000_000.0),
+            _job(2, "run / tt-xla-b", sps=100.0),
+            _job(3, "run / tt-xla-c", sps=100.0),
+        ],
+        [
+            _job(4, "run / tt-xla-a", sps=120.0, duration_ns=1_200_000.0),
+            _job(5, "run / tt-xla-b", sps=94.0),
+            _job(6, "run / tt-xla-c", sps=104.0),
+        ],
+    )
+    a, b, c = comparisons
+
+    # Faster simulation but slower device perf is both at once
+    assert a.samples_per_sec_delta == 20.0
+    assert a.device_perf_delta_ns == 200_000.0
+    assert a.device_perf_delta_ms == 0.2
+    assert math.isclose(a.device_perf_percent_change, 20.0)
+    assert (a.is_regression, a.is_improvement) == (True, True)
+    assert (b.is_regression, b.is_improvement) == (True, False)
+    assert (c.is_regression, c.is_improvement) == (False, False)
+
+
+def test_status_transitions():
+    comparisons = _compare(
+        [
+            _job(1, "run / tt-xla-a"),
+            _job(2, "run / tt-xla-b", conclusion=JobConclusion.FAILURE),
+        ],
+        [
+            _job(3, "run / tt-xla-a", conclusion=JobConclusion.FAILURE),
+            _job(4, "run / tt-xla-b"),
+        ],
+    )
+
+    assert [
+        (c.status_changed, c.is_regression, c.is_improvement) for c in comparisons
+    ] == [
+        (True, True, False),
+        (True, False, True),
+    ]
+
+
+def test_jobs_skipped_in_both_runs_are_not_compared():
+    (comparison,) = _compare(
+        [_job(1, "run / tt-xla-a", conclusion=JobConclusion.SKIPPED, sps=1.0)],
+        [_job(2, "run / tt-xla-a", conclusion=JobConclusion.SKIPPED, sps=2.0)],
+    )
+
+    assert comparison.samples_per_sec_delta is None
+    assert not comparison.is_regression
+
+
+def test_zero_baseline_gives_signed_infinite_percent_change():
+    up, same = _compare(
+        [_job(1, "run / tt-xla-a", sps=0.0), _job(2, "run / tt-xla-b", sps=0.0)],
+        [_job(3, "run / tt-xla-a", sps=5.0), _job(4, "run / tt-xla-b", sps=0.0)],
+    )
+
+    assert up.samples_per_sec_percent_change == math.inf
+    assert up.is_improvement
+    assert same.samples_per_sec_percent_change == 0.0
+    assert not (same.is_regression or same.is_improvement)
@@ -0,0 +1,147 @@
+"""Tests for the device perf CSV parser."""
+
+import io
+import zipfile
+
+import pytest
+
+from gh_perf_report.parsers.csv_parser import CSVParser
+from gh_perf_report.utils.errors import ParseError
+
+HEADER = (
+    "OP CODE,DEVICE KERNEL DURATION [ns],OP TO OP LATENCY [ns],"
+    "CONST_EVAL_OP,INPUT_LAYOUT_CONVERSION_OP\n"
+)
+
+
+def _zip(members, compression=zipfile.ZIP_DEFLATED) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression) as zf:
+        for name, content in members:
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def test_parse_device_perf_csv_filters_flagged_rows():
+    csv_content = HEADER + (
+        "add,100,1,False,False\n"
+        "mul,200,1,True,False\n"
+        "sub,400,1,False,yes\n"
+        "div,300,1, FALSE ,no\n"
+        "bad,,1,False,False\n"
+        "nan,abc,1,False,False\n"
+    )
+
+    metrics = CSVParser().parse_device_perf_csv(csv_content)
+
+    assert metrics.total_op_duration_ns == 400.0
+    assert metrics.filtered_op_count == 2
+    assert metrics.avg_op_duration_ns == 200.0
+
+
+def test_parse_all_csvs_tracks_stages_in_filename_order():
+    data = _zip(
+        [
+            ("b.csv", HEADER + "add,30,1,False,False\n"),
+            ("a.csv", HEADER + "add,10,1,False,False\nmul,20,1,False,False\n"),
+            ("empty.csv", ""),
+            ("notes.txt", "ignored"),
+        ]
+    )
+
+    metrics = CSVParser().parse_all_csvs_from_bytes(data)
+
+    assert metrics.total_op_duration_ns == 60.0
+    assert metrics.filtered_op_count == 3
+    assert [(s.stage_name, s.duration_ns, s.op_count) for s in metrics.stages] == [
+        ("Stage 1", 30.0, 2),
+        ("Stage 2", 30.0, 1),
+    ]
+
+
+def test_parse_all_csvs_from_zip_path(tmp_path):
+    zip_path = tmp_path / "artifact.zip"
+    zip_path.write_bytes(_zip([("a.csv", HEADER + "add,5,1,False,False\n")]))
+
+    metrics = CSVParser().parse_all_csvs_from_zip(str(zip_path))
+
+    assert metrics.total_op_duration_ns == 5.0
+    assert metrics.num_stages == 1
+
+
+def test_member_missing_columns_is_skipped():
+    data = _zip(
+        [
+            ("a.csv", HEADER + "add,100,1,False,False\n"),
+            ("b.csv", "x,y\n1,2\n"),
+        ]
+    )
+
+    metrics = CSVParser().parse_all_csvs_from_bytes(data)
+
+    assert metrics.total_op_duration_ns == 100.0
+    assert metrics.num_stages == 1
+
+
+def test_malformed_member_is_skipped():
+    oversized = HEADER + 'add,"' + "x" * 200_000 + '",1,False,False\n'
+    data = _zip(
+        [
+            ("a.csv", HEADER + "add,100,1,False,False\n"),
+            ("b.csv", oversized),
+        ]
+    )
+
+    metrics = CSVParser().parse_all_csvs_from_bytes(data)
+
+    assert metrics.total_op_duration_ns == 100.0
+    assert metrics.num_stages == 1
+
+
+def test_undecodable_member_fails_the_artifact():
+    data = _zip(
+        [
+            ("a.csv", HEADER + "add,100,1,False,False\n"),
+            ("b.csv", HEADER.encode() + b"\xff\xfe,5,1,False,False\n"),
+        ]
+    )
+
+    with pytest.raises(ParseError, match="Failed to extract CSV from ZIP"):
+        CSVParser().parse_all_csvs_from_bytes(data)
+
+
+def test_corrupt_member_fails_the_artifact():
+    good = HEADER + "add,100,1,False,False\n"
+    data = bytearray(_zip([("a.csv", good), ("b.csv", good)], zipfile.ZIP_STORED))
+    # Flip a byte of the stored content so its CRC no longer matches
+    offset = data.rfind(b"add,100")
+    data[offset + 4] = ord("9")
+
+    with pytest.raises(ParseError):
+        CSVParser().parse_all_csvs_from_bytes(bytes(data))
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"not a zip", "Invalid ZIP file"),
+        (_zip([("notes.txt", "x")]), "No CSV file found"),
+        (
+            _zip([("a.csv", HEADER + "add,1,1,True,False\n")]),
+            "No valid device perf data",
+        ),
+    ],
+)
+def test_artifact_without_usable_csvs_raises(data, message):
+    with pytest.raises(ParseError, match=message):
+        CSVParser().parse_all_csvs_from_bytes(data)
+
+
+def test_extract_csvs_from_artifact_zip(tmp_path):
+    zip_path = tmp_path / "artifact.zip"
+    zip_path.write_bytes(_zip([("b.csv", "2"), ("a.csv", "1"), ("notes.txt", "x")]))
+
+    assert CSVParser().extract_csvs_from_artifact_zip(str(zip_path)) == [
+        ("a.csv", "1"),
+        ("b.csv", "2"),
+    ]
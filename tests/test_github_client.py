@@ -0,0 +1,167 @@
+"""Tests for the GitHub API client, run against a fake session."""
+
+import json
+
+import pytest
+import requests
+
+from gh_perf_report.api.github_client import GitHubClient, _normalize_job_name
+from gh_perf_report.api.rate_limiter import RateLimiter
+from gh_perf_report.api.response_cache import ResponseCache
+
+RUN = {"id": 5, "name": "Perf", "run_attempt": 1, "status": "completed"}
+JOBS = [
+    {"id": i, "name": f"run / tt-xla-model{i} (n150-perf, 1, 2) benchmark"}
+    for i in range(150)
+]
+ARTIFACTS = [{"id": 1000 + i, "name": f"device-perf-{i}"} for i in range(3)]
+
+
+class _FakeSession(requests.Session):
+    """Session answering a single workflow run, recording every request."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        self.calls.append(url)
+        response = requests.Response()
+        response.url = url
+        if headers and headers.get("If-None-Match") == '"etag"':
+            response.status_code = 304
+            response._content = b""
+            return response
+
+        response.status_code = 200
+        response.headers["ETag"] = '"etag"'
+        if url.endswith("/runs/5"):
+            body = RUN
+        elif url.endswith("/runs/5/jobs"):
+            # First page of two; the next link carries the query itself
+            body = {"jobs": JOBS[:100]}
+            response.headers["Link"] = f'<{url}?page=2>; rel="next"'
+        elif url.endswith("/runs/5/jobs?page=2"):
+            body = {"jobs": JOBS[100:]}
+        elif url.endswith("/runs/5/artifacts"):
+            body = {"artifacts": ARTIFACTS}
+        else:
+            response.status_code = 404
+            body = {}
+        response._content = json.dumps(body).encode("utf-8")
+        return response
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    monkeypatch.setenv("GH_TOKEN", "token")
+
+    def make():
+        client = GitHubClient(rate_limiter=RateLimiter(1000, 1000), use_cache=False)
+        client.disk_cache = ResponseCache(tmp_path)
+        client._session = _FakeSession()
+        return client
+
+    return make
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "build_artifact_cache",
+        "download_artifact",
+        "download_artifact_stream",
+        "find_device_perf_artifact",
+        "find_device_perf_artifact_by_job_name",
+        "get_job",
+        "iter_artifacts",
+        "list_artifacts",
+        "list_artifacts_many",
+    ],
+)
+def test_public_methods_exist(method):
+    assert hasattr(GitHubClient, method)
+
+
+@pytest.mark.parametrize(
+    "job_name, key",
+    [
+        (
+            "run-n150-perf-benchmarks / TT-XLA-ResNet (n150-perf, 12, 128) benchmark",
+            "tt-xla-resnet",
+        ),
+        (
+            "run-n150-perf-benchmarks / perf llama_3.2 (n150-perf)",
+            "n150-perf/llama_3.2",
+        ),
+        ("run-n150-perf-benchmarks / perf llama_3.2 (p150)", "p150/llama_3.2"),
+        ("Build Wheel", "build wheel"),
+    ],
+)
+def test_normalize_job_name(job_name, key):
+    assert _normalize_job_name(job_name) == key
+
+
+def test_run_bundle_follows_pagination(make_client):
+    client = make_client()
+
+    run, jobs, artifacts = client.get_run_bundle("owner", "repo", 5)
+
+    assert run == RUN
+    assert [job["id"] for job in jobs] == list(range(150))
+    assert artifacts == ARTIFACTS
+    assert len(client._session.calls) == 4
+
+
+def test_artifacts_are_matched_by_job(make_client):
+    client = make_client()
+    cache = client.build_artifact_cache("owner", "repo", 5)
+
+    assert (
+        client.find_device_perf_artifact_by_job_name(
+            "owner", "repo", 5, JOBS[1]["name"], cache
+        )
+        == ARTIFACTS[1]
+    )
+    assert client.find_device_perf_artifact("owner", "repo", 5, 2) == ARTIFACTS[2]
+    assert client.find_device_perf_artifact("owner", "repo", 5, 99) is None
+
+
+def test_completed_run_listings_are_served_from_disk(make_client):
+    make_client().get_run_bundle("owner", "repo", 5)
+
+    client = make_client()
+    run, jobs, artifacts = client.get_run_bundle("owner", "repo", 5)
+
+    # Only the run itself is revalidated; its listings are final
+    assert client._session.calls == [
+        "https://api.github.com/repos/owner/repo/actions/runs/5"
+    ]
+    assert run == RUN
+    assert len(jobs) == 150
+    assert artifacts == ARTIFACTS
+
+
+def test_iter_artifacts_reuses_fetched_listing(make_client):
+    client = make_client()
+    client.get_run_bundle("owner", "repo", 5)
+    calls = len(client._session.calls)
+
+    assert list(client.iter_artifacts("owner", "repo", 5)) == ARTIFACTS
+    assert len(client._session.calls) == calls
+
+
+def test_list_artifacts_many(make_client, monkeypatch):
+    client = make_client()
+    monkeypatch.setattr(
+        client, "list_artifacts", lambda owner, repo, run_id: [{"run": run_id}]
+    )
+
+    assert client.list_artifacts_many("owner", "repo", [1, 2]) == {
+        1: [{"run": 1}],
+        2: [{"run": 2}],
+    }
+
+
+def test_get_job_returns_none_on_error(make_client):
+    assert make_client().get_job("owner", "repo", 1) is None
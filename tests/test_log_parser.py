@@ -0,0 +1,116 @@
+"""Tests for the benchmark log parser."""
+
+import random
+import re
+
+import pytest
+
+from gh_perf_report.parsers.log_parser import LogParser
+from gh_perf_report.parsers.patterns import ERROR_PATTERNS
+
+JOB_NAME = "run-n150-perf-benchmarks / tt-xla-resnet (n150-perf, 12, 128) benchmark"
+
+
+@pytest.fixture
+def parser():
+    return LogParser()
+
+
+def test_parse_simulation_metrics(parser):
+    logs = (
+        "setup\n"
+        "Samples per second: 123.45\n"
+        "Total execution time: 6.5\n"
+        "Total samples: 800\n"
+        "Batch size: 8\n"
+        "Model type: cnn\n"
+    )
+
+    metrics = parser.parse_simulation_metrics(logs, JOB_NAME)
+
+    assert metrics.model_name == "resnet"
+    assert metrics.samples_per_second == 123.45
+    assert metrics.total_execution_time == 6.5
+    assert metrics.total_samples == 800
+    assert metrics.batch_size == 8
+    assert metrics.metadata == {}
+
+
+def test_parse_simulation_metrics_with_metadata(parser):
+    logs = "sample per SECOND: 3\nModel type: cnn \nDataset name: imagenet\n"
+
+    metrics = parser.parse_simulation_metrics(logs, JOB_NAME, parse_metadata=True)
+
+    assert metrics.samples_per_second == 3.0
+    assert metrics.total_samples is None
+    assert metrics.metadata == {"model_type": "cnn", "dataset_name": "imagenet"}
+
+
+@pytest.mark.parametrize("logs", ["", "no metrics here\n", "second: \n"])
+def test_parse_simulation_metrics_without_samples_per_second(parser, logs):
+    assert parser.parse_simulation_metrics(logs, JOB_NAME) is None
+
+
+@pytest.mark.parametrize(
+    "job_name, model_name",
+    [
+        (JOB_NAME, "resnet"),
+        ("run-n150-perf-benchmarks / perf llama_3.2 (n150-perf)", "llama_3.2"),
+        ("build", "build"),
+    ],
+)
+def test_model_name_from_job_name(parser, job_name, model_name):
+    metrics = parser.parse_simulation_metrics("Samples per second: 1\n", job_name)
+    assert metrics.model_name == model_name
+
+
+def test_find_error_in_logs_earliest_error_wins(parser):
+    logs = "FAILED: test_x\nError: boom\n"
+    assert parser.find_error_in_logs(logs) == "test_x"
+
+
+def test_find_error_in_logs_traceback(parser):
+    logs = "Traceback (most recent call last):\n  File x\nValueError: nope\n"
+    assert parser.find_error_in_logs(logs) == "nope"
+
+
+def test_find_error_in_logs_truncates_long_messages(parser):
+    error = parser.find_error_in_logs("Error: " + "x" * 600 + "\n")
+    assert error == "x" * 500 + "..."
+
+
+def test_find_error_in_logs_without_errors(parser):
+    assert parser.find_error_in_logs("all good\n") is None
+
+
+def test_find_error_in_logs_matches_combined_pattern(parser):
+    # A single alternation of all error patterns returns the earliest match,
+    # preferring earlier patterns at the same position
+    combined = re.compile(
+        "|".join(f"(?:{p})" for p in ERROR_PATTERNS), re.MULTILINE | re.DOTALL
+    )
+
+    def expected(logs):
+        match = combined.search(logs)
+        if not match:
+            return None
+        error = match.group(match.lastindex).strip()
+        return error if len(error) <= 500 else f"{error[:500]}..."
+
+    tokens = [
+        "Error: a",
+        "ERROR: b",
+        "FAILED: c",
+        "Exception: d",
+        "Traceback x",
+        "ValueError: v",
+        "\n",
+        "foo ",
+        "Exception:",
+        "Error:\n",
+        "RuntimeError: r\n",
+    ]
+    rng = random.Random(1)
+    for _ in range(5000):
+        logs = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 12)))
+        assert parser.find_error_in_logs(logs) == expected(logs), repr(logs)
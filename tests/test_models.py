@@ -0,0 +1,74 @@
+"""Tests for the report data models."""
+
+from gh_perf_report.processors.models import (
+    DevicePerfMetrics,
+    JobConclusion,
+    JobResult,
+    JobStatus,
+    StagePerfMetrics,
+    WorkflowReport,
+)
+
+
+def _report(jobs):
+    return WorkflowReport(
+        run_id=1,
+        repo="tenstorrent/tt-xla",
+        workflow_name="Perf",
+        branch="main",
+        created_at="2026-01-01",
+        status="completed",
+        conclusion="success",
+        jobs=jobs,
+    )
+
+
+def _job(job_id, conclusion, num_stages=0):
+    device_perf = None
+    if num_stages:
+        device_perf = DevicePerfMetrics(
+            total_op_duration_ns=float(num_stages),
+            filtered_op_count=num_stages,
+            avg_op_duration_ns=1.0,
+            stages=[
+                StagePerfMetrics(f"Stage {i + 1}", 1.0, 1) for i in range(num_stages)
+            ],
+        )
+    return JobResult(
+        job_id=job_id,
+        job_name=f"job {job_id}",
+        status=JobStatus.COMPLETED,
+        conclusion=conclusion,
+        device_perf_metrics=device_perf,
+    )
+
+
+def test_conclusion_counts():
+    report = _report(
+        [
+            _job(1, JobConclusion.SUCCESS),
+            _job(2, JobConclusion.SUCCESS),
+            _job(3, JobConclusion.FAILURE),
+            _job(4, JobConclusion.SKIPPED),
+            _job(5, None),
+        ]
+    )
+
+    assert (report.success_count, report.failure_count, report.skipped_count) == (
+        2,
+        1,
+        1,
+    )
+
+
+def test_max_stages_is_derived_from_jobs():
+    report = _report(
+        [
+            _job(1, JobConclusion.SUCCESS, num_stages=2),
+            _job(2, JobConclusion.SUCCESS, num_stages=3),
+            _job(3, JobConclusion.FAILURE),
+        ]
+    )
+
+    assert report.max_stages == 3
+    assert _report([]).max_stages == 0
@@ -0,0 +1,56 @@
+"""Tests for the API rate limiter."""
+
+import pytest
+
+from gh_perf_report.api import rate_limiter
+from gh_perf_report.api.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    """Stand-in for time.monotonic()/time.sleep() that only advances on sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_does_not_wait(clock):
+    limiter = RateLimiter(calls_per_second=10, burst=5)
+    for _ in range(5):
+        limiter.wait_if_needed()
+
+    assert clock.sleeps == []
+
+
+def test_calls_beyond_burst_wait_for_the_average_rate(clock):
+    limiter = RateLimiter(calls_per_second=10, burst=2)
+    for _ in range(5):
+        limiter.wait_if_needed()
+
+    assert clock.sleeps == pytest.approx([0.1, 0.1, 0.1])
+
+
+def test_tokens_refill_over_time(clock):
+    limiter = RateLimiter(calls_per_second=10, burst=2)
+    limiter.wait_if_needed()
+    limiter.wait_if_needed()
+    clock.now += 0.2
+    limiter.wait_if_needed()
+    limiter.wait_if_needed()
+
+    assert clock.sleeps == []
@@ -0,0 +1,60 @@
+"""Tests for the on-disk response cache."""
+
+import os
+
+from gh_perf_report.api.response_cache import ResponseCache
+
+
+def test_set_and_get(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.set(("jobs", "owner", "repo", 1), {"jobs": [1, 2]})
+
+    assert cache.get(("jobs", "owner", "repo", 1)) == {"jobs": [1, 2]}
+    assert cache.get(("jobs", "owner", "repo", 2)) is None
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(tmp_path)
+    key = ("run", "owner", "repo", 1)
+    cache.set(key, {"id": 1})
+    cache._response_path(key).write_text("{not json")
+
+    assert cache.get(key) is None
+
+
+def test_artifact_bytes(tmp_path):
+    cache = ResponseCache(tmp_path)
+    assert cache.get_artifact_bytes(7) is None
+
+    cache.set_artifact_bytes(7, b"zip")
+
+    assert cache.get_artifact_bytes(7) == b"zip"
+
+
+def test_artifact_file(tmp_path):
+    cache = ResponseCache(tmp_path / "cache")
+    source = tmp_path / "download.zip"
+    source.write_bytes(b"zip")
+    output = tmp_path / "copy.zip"
+    assert not cache.get_artifact(7, str(output))
+
+    cache.set_artifact(7, str(source))
+
+    assert cache.get_artifact(7, str(output))
+    assert output.read_bytes() == b"zip"
+
+
+def test_least_recently_used_artifacts_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path, max_artifact_bytes=250)
+    for artifact_id in range(2):
+        cache.set_artifact_bytes(artifact_id, b"x" * 100)
+        # Distinct, increasing mtimes regardless of filesystem resolution
+        os.utime(cache.artifact_path(artifact_id), (artifact_id, artifact_id))
+
+    # Reading artifact 0 makes artifact 1 the least recently used
+    assert cache.get_artifact_bytes(0) is not None
+    cache.set_artifact_bytes(2, b"x" * 100)
+
+    assert cache.get_artifact_bytes(0) is not None
+    assert cache.get_artifact_bytes(1) is None
+    assert cache.get_artifact_bytes(2) is not None